@@ -8,6 +8,12 @@ from dotenv import load_dotenv
 import json
 from typing import Dict, Any
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Load environment variables
 load_dotenv()
 
@@ -15,6 +21,7 @@ class Config:
     """Configuration management class"""
     
     def __init__(self):
+        self._flat = {}
         self.load_default_config()
         self.load_user_config()
     
@@ -61,9 +68,16 @@ class Config:
                 "background_color": "#0A0A0A",
                 "text_color": "#FFFFFF",
                 "window_size": "1200x800",
-                "transparency": 0.95
+                "transparency": 0.95,
+                "animate_title": False
             },
             
+            # Conversation history
+            "history": {
+                "max_messages": 64,
+                "summary_threshold": 20
+            },
+
             # Languages
             "languages": {
                 "supported": ["pt-BR", "en-US", "es-ES", "fr-FR", "de-DE"],
@@ -76,46 +90,69 @@ class Config:
                 "wake_word": "jarvis",
                 "auto_listen": True,
                 "face_recognition": False,
+                # Expected on-screen face size range in pixels; a tight
+                # range keeps the detector's image pyramid shallow
+                "face_min_size": 80,
+                "face_max_size": 256,
+                "face_scale_factor": 1.2,
                 "gesture_control": False,
                 "home_automation": False
             }
         }
-    
+        self._rebuild_flat()
+
     def load_user_config(self):
         """Load user-specific configuration"""
         config_file = "config/user_config.json"
         if os.path.exists(config_file):
             try:
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    user_config = json.load(f)
-                    self.merge_config(user_config)
+                if ORJSON_AVAILABLE:
+                    with open(config_file, 'rb') as f:
+                        user_config = orjson.loads(f.read())
+                else:
+                    with open(config_file, 'r', encoding='utf-8') as f:
+                        user_config = json.load(f)
+                self.merge_config(user_config)
             except Exception as e:
                 print(f"Error loading user config: {e}")
     
     def merge_config(self, user_config: Dict[str, Any]):
         """Merge user configuration with default configuration"""
-        def deep_merge(default: dict, user: dict) -> dict:
+        if not user_config:
+            return
+
+        # Iterative merge with an explicit work stack; avoids a Python
+        # call frame per nested dict level
+        stack = [(self.config, user_config)]
+        while stack:
+            default, user = stack.pop()
             for key, value in user.items():
                 if key in default and isinstance(default[key], dict) and isinstance(value, dict):
-                    deep_merge(default[key], value)
+                    stack.append((default[key], value))
                 else:
                     default[key] = value
-            return default
-        
-        self.config = deep_merge(self.config, user_config)
+
+        self._rebuild_flat()
+
+    def _rebuild_flat(self):
+        """Rebuild the flat dot-notation lookup table"""
+        flat = {}
+
+        def flatten(node: dict, prefix: str):
+            for key, value in node.items():
+                dotted = f"{prefix}{key}"
+                flat[dotted] = value
+                if isinstance(value, dict):
+                    flatten(value, dotted + '.')
+
+        flatten(self.config, '')
+        self._flat = flat
     
     def get(self, key: str, default=None):
         """Get configuration value using dot notation"""
-        keys = key.split('.')
-        value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        # Single dict lookup instead of splitting the key and walking
+        # the nested config on every call (get() sits in hot paths)
+        return self._flat.get(key, default)
     
     def set(self, key: str, value: Any):
         """Set configuration value using dot notation"""
@@ -128,13 +165,35 @@ class Config:
             config = config[k]
         
         config[keys[-1]] = value
-    
+        self._rebuild_flat()
+
+    def set_many(self, values: Dict[str, Any]):
+        """Set several dot-notation keys with one flat-table rebuild"""
+        for key, value in values.items():
+            keys = key.split('.')
+            config = self.config
+
+            for k in keys[:-1]:
+                if k not in config:
+                    config[k] = {}
+                config = config[k]
+
+            config[keys[-1]] = value
+
+        self._rebuild_flat()
+
     def save_user_config(self):
         """Save current configuration to user config file"""
         os.makedirs("config", exist_ok=True)
         
-        with open("config/user_config.json", 'w', encoding='utf-8') as f:
-            json.dump(self.config, f, indent=4, ensure_ascii=False)
+        if ORJSON_AVAILABLE:
+            # orjson serializes straight to UTF-8 bytes, skipping the
+            # str encode round-trip of the stdlib writer
+            with open("config/user_config.json", 'wb') as f:
+                f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2))
+        else:
+            with open("config/user_config.json", 'w', encoding='utf-8') as f:
+                json.dump(self.config, f, indent=4, ensure_ascii=False)
 
 # Global configuration instance
 config = Config()
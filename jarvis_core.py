@@ -3,11 +3,23 @@ JARVIS Core Module
 Main system coordination and AI processing
 """
 
+import re
 import threading
 import time
 from typing import Dict, Any, Callable, Optional
 import queue
-from datetime import datetime
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from itertools import islice
+from typing import NamedTuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 from config.config import config
 from ai.openrouter_client import OpenRouterClient
@@ -17,6 +29,97 @@ from camera.camera_manager import CameraManager
 from automation.system_control import SystemController
 from utils.logger import get_logger
 
+# Keyword -> (category, action, is_trigger). A trigger word selects the
+# command category ("volume", "câmera"); an action word alone is not
+# enough to fire a command.
+_COMMAND_KEYWORDS = {
+    # Camera
+    'câmera': ('camera', None, True),
+    'camera': ('camera', None, True),
+    'foto': ('camera', 'photo', True),
+    'picture': ('camera', 'photo', True),
+    'capturar': ('camera', 'photo', False),
+    'ligar': ('camera', 'on', False),
+    'ativar': ('camera', 'on', False),
+    'turn on': ('camera', 'on', False),
+    'desligar': ('camera', 'off', False),
+    'desativar': ('camera', 'off', False),
+    'turn off': ('camera', 'off', False),
+
+    # Volume
+    'volume': ('volume', None, True),
+    'som': ('volume', None, True),
+    'aumentar': ('volume', 'up', False),
+    'increase': ('volume', 'up', False),
+    'up': ('volume', 'up', False),
+    'diminuir': ('volume', 'down', False),
+    'decrease': ('volume', 'down', False),
+    'down': ('volume', 'down', False),
+    'mudo': ('volume', 'mute', False),
+    'mute': ('volume', 'mute', False),
+
+    # Language
+    'idioma': ('language', None, True),
+    'language': ('language', None, True),
+    'inglês': ('language', 'en', False),
+    'english': ('language', 'en', False),
+    'português': ('language', 'pt', False),
+    'portuguese': ('language', 'pt', False),
+    'espanhol': ('language', 'es', False),
+    'spanish': ('language', 'es', False),
+}
+
+# Compiled fallback scanner for when pyahocorasick is missing: one C
+# regex pass instead of a Python-level substring test per keyword. The
+# lookahead keeps overlapping keywords (e.g. "ligar" in "desligar")
+# visible, matching plain substring semantics.
+_KEYWORD_RE = re.compile(
+    '(?=(' + '|'.join(
+        re.escape(word)
+        for word in sorted(_COMMAND_KEYWORDS, key=len, reverse=True)
+    ) + '))'
+)
+
+class Msg(NamedTuple):
+    """Compact conversation-history record
+
+    A NamedTuple is a fraction of the size of the dicts the history used
+    to hold, which matters over a long session; entries are converted to
+    wire-shape dicts only when a request payload is built.
+    """
+    role: str
+    content: str
+    lang: str
+
+
+# Persona prompts per language, frozen at module scope so building the
+# AI context allocates nothing for them per turn
+_SYSTEM_PROMPTS = MappingProxyType({
+    'pt-BR': {
+        'role': 'system',
+        'content': 'Você é JARVIS, um assistente virtual inteligente. Seja útil, conciso e amigável. Responda sempre em português brasileiro.'
+    },
+    'en-US': {
+        'role': 'system',
+        'content': 'You are JARVIS, an intelligent virtual assistant. Be helpful, concise and friendly. Always respond in English.'
+    },
+    'es-ES': {
+        'role': 'system',
+        'content': 'Eres JARVIS, un asistente virtual inteligente. Sé útil, conciso y amigable. Responde siempre en español.'
+    }
+})
+
+# Sentence boundary inside a streamed response; trailing whitespace is
+# required so decimals like "3.5" are not split mid-number
+_SENTENCE_END_RE = re.compile(r'[.!?]+\s')
+
+# Dispatch order mirrors the original if-chain priority
+_COMMAND_PRIORITY = (
+    ('camera', 'on'), ('camera', 'off'), ('camera', 'photo'),
+    ('volume', 'up'), ('volume', 'down'), ('volume', 'mute'),
+    ('language', 'en'), ('language', 'pt'), ('language', 'es'),
+)
+
 class JarvisCore:
     """Core JARVIS system that coordinates all components"""
     
@@ -35,11 +138,24 @@ class JarvisCore:
         self.is_speaking = False
         self.is_processing = False
         self.wake_word_detected = False
+
+        # Idle gate for the wake-word listener: cleared while speaking
+        # or processing so the listener blocks instead of polling
+        self._idle = threading.Event()
+        self._idle.set()
+        self._busy_count = 0
+        self._busy_lock = threading.Lock()
         
-        # Communication queues
-        self.command_queue = queue.Queue()
-        self.response_queue = queue.Queue()
+        # Communication queues (SimpleQueue: C implementation without
+        # Queue's Python-level condition/notify overhead; join/task_done
+        # semantics were never used)
+        self.command_queue = queue.SimpleQueue()
+        self.response_queue = queue.SimpleQueue()
         
+        # Shared worker pool: reused for component init and per-command
+        # listening instead of spawning a fresh thread each time
+        self._pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='jarvis')
+
         # Event callbacks
         self.callbacks = {
             'on_wake_word': [],
@@ -48,40 +164,88 @@ class JarvisCore:
             'on_error': [],
             'on_status_change': []
         }
+
+        # Flat tuples rebuilt on registration so _trigger_callback can
+        # early-return without a dict/list dance per state transition
+        self._cb_cache = {}
+        self._last_status = None
         
-        # Current conversation context
-        self.conversation_history = []
+        # Current conversation context (bounded so long sessions don't
+        # grow memory without limit)
+        self.conversation_history = deque(
+            maxlen=config.get('history.max_messages', 64)
+        )
+
+        # Rolling summary of turns older than the context window; keeps
+        # prompt tokens flat while preserving long-session context
+        self.history_summary = ""
+        self._summary_threshold = config.get('history.summary_threshold', 20)
+        self._summarizing = False
+
+        # Stable id for this session so the AI provider can reuse its
+        # prompt cache across turns of the same conversation
+        self.conversation_id = uuid.uuid4().hex
         self.current_language = config.get('languages.default', 'pt-BR')
         
+        # Keyword routing: a single Aho-Corasick pass over the command
+        # replaces the chain of per-keyword substring scans when the
+        # pyahocorasick extension is installed
+        self._keyword_automaton = None
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for word, info in _COMMAND_KEYWORDS.items():
+                automaton.add_word(word, info)
+            automaton.make_automaton()
+            self._keyword_automaton = automaton
+
+        self._command_dispatch = {
+            ('camera', 'on'): self._cmd_camera_on,
+            ('camera', 'off'): self._cmd_camera_off,
+            ('camera', 'photo'): self._cmd_camera_photo,
+            ('volume', 'up'): self._cmd_volume_up,
+            ('volume', 'down'): self._cmd_volume_down,
+            ('volume', 'mute'): self._cmd_volume_mute,
+            ('language', 'en'): self._cmd_language_en,
+            ('language', 'pt'): self._cmd_language_pt,
+            ('language', 'es'): self._cmd_language_es,
+        }
+
         self.initialize_components()
         self.start_background_threads()
     
     def initialize_components(self):
         """Initialize all JARVIS components"""
         try:
-            # Initialize AI client
+            # The components are independent and their setups are mostly
+            # I/O-bound (driver opens, model loads), so initialize them
+            # in parallel: startup costs max(init) instead of sum(init)
+            ai_future = None
             if config.get('openrouter.api_key'):
-                self.ai_client = OpenRouterClient()
-                self.logger.info("OpenRouter AI client initialized")
+                ai_future = self._pool.submit(OpenRouterClient)
             else:
                 self.logger.warning("OpenRouter API key not found")
-            
-            # Initialize speech engine
-            self.speech_engine = SpeechEngine()
+
+            speech_future = self._pool.submit(SpeechEngine)
+            recognition_future = self._pool.submit(RecognitionEngine)
+            camera_future = self._pool.submit(CameraManager)
+            system_future = self._pool.submit(SystemController)
+
+            if ai_future is not None:
+                self.ai_client = ai_future.result()
+                self.logger.info("OpenRouter AI client initialized")
+
+            self.speech_engine = speech_future.result()
             self.logger.info("Speech engine initialized")
-            
-            # Initialize recognition engine
-            self.recognition_engine = RecognitionEngine()
+
+            self.recognition_engine = recognition_future.result()
             self.logger.info("Speech recognition initialized")
-            
-            # Initialize camera
-            self.camera_manager = CameraManager()
+
+            self.camera_manager = camera_future.result()
             self.logger.info("Camera manager initialized")
-            
-            # Initialize system controller
-            self.system_controller = SystemController()
+
+            self.system_controller = system_future.result()
             self.logger.info("System controller initialized")
-            
+
         except Exception as e:
             self.logger.error(f"Error initializing components: {e}")
             raise
@@ -103,22 +267,46 @@ class JarvisCore:
             )
             self.voice_activation_thread.start()
     
+    def _enter_busy(self):
+        """Mark JARVIS busy; blocks the wake-word listener"""
+        with self._busy_lock:
+            self._busy_count += 1
+            self._idle.clear()
+
+    def _exit_busy(self):
+        """Leave a busy section; wakes the listener when fully idle"""
+        with self._busy_lock:
+            self._busy_count = max(0, self._busy_count - 1)
+            if self._busy_count == 0:
+                self._idle.set()
+
     def _voice_activation_listener(self):
         """Background thread for wake word detection"""
         wake_word = config.get('features.wake_word', 'jarvis').lower()
-        
+
         while True:
             try:
-                if not self.is_speaking and not self.is_processing:
-                    audio_text = self.recognition_engine.listen_for_wake_word()
-                    
-                    if audio_text and wake_word in audio_text.lower():
-                        self.wake_word_detected = True
-                        self._trigger_callback('on_wake_word', audio_text)
-                        self.start_listening()
-                
-                time.sleep(0.1)
-                
+                # Block until JARVIS is idle instead of waking 10x/s
+                # while it speaks or processes; resumes immediately
+                self._idle.wait()
+
+                # The engine filters on the wake word itself, so no
+                # per-iteration lower()/substring work happens here
+                listen_start = time.monotonic()
+                audio_text = self.recognition_engine.listen_for_wake_word(
+                    target=wake_word
+                )
+
+                if audio_text:
+                    self.wake_word_detected = True
+                    self._trigger_callback('on_wake_word', audio_text)
+                    self.start_listening()
+                elif time.monotonic() - listen_start < 0.05:
+                    # The engine returned without actually listening
+                    # (no microphone, or the command listener holds
+                    # the stream); pace the loop instead of spinning
+                    time.sleep(0.1)
+
             except Exception as e:
                 self.logger.error(f"Error in voice activation: {e}")
                 time.sleep(1)
@@ -129,8 +317,7 @@ class JarvisCore:
             try:
                 command_data = self.command_queue.get(timeout=1)
                 self._process_command(command_data)
-                self.command_queue.task_done()
-                
+
             except queue.Empty:
                 continue
             except Exception as e:
@@ -140,6 +327,7 @@ class JarvisCore:
         """Process a voice command"""
         try:
             self.is_processing = True
+            self._enter_busy()
             self._trigger_callback('on_status_change', 'processing')
             
             command_text = command_data.get('text', '')
@@ -148,32 +336,36 @@ class JarvisCore:
             self.logger.info(f"Processing command: {command_text}")
             
             # Add to conversation history
-            self.conversation_history.append({
-                'role': 'user',
-                'content': command_text,
-                'timestamp': datetime.now(),
-                'language': language
-            })
+            self.conversation_history.append(
+                Msg('user', command_text, language)
+            )
             
             # Check for system commands first
             system_response = self._handle_system_commands(command_text)
             
+            spoken = False
             if system_response:
                 response = system_response
+            elif self.ai_client:
+                # Stream the answer, speaking completed sentences while
+                # later tokens are still being generated
+                response = self._process_with_ai_stream(command_text, language)
+                spoken = True
             else:
-                # Process with AI
                 response = self._process_with_ai(command_text, language)
-            
+
             # Add response to history
-            self.conversation_history.append({
-                'role': 'assistant',
-                'content': response,
-                'timestamp': datetime.now(),
-                'language': language
-            })
-            
-            # Speak the response
-            self.speak(response, language)
+            self.conversation_history.append(
+                Msg('assistant', response, language)
+            )
+
+            # Fold older turns into the rolling summary off the hot path
+            self._maybe_summarize_history(language)
+
+            # Speak the response (unless it was already spoken while
+            # streaming)
+            if not spoken:
+                self.speak(response, language)
             
             # Trigger callbacks
             self._trigger_callback('on_command', command_data)
@@ -190,49 +382,81 @@ class JarvisCore:
         
         finally:
             self.is_processing = False
+            self._exit_busy()
             self._trigger_callback('on_status_change', 'idle')
-    
+
+    def _scan_keywords(self, text: str):
+        """Collect keyword matches in a single pass over the command
+
+        Returns (triggered categories, {category: matched actions}).
+        """
+        triggered = set()
+        actions = {}
+
+        if self._keyword_automaton is not None:
+            matched = (info for _, info in self._keyword_automaton.iter(text))
+        else:
+            matched = (
+                _COMMAND_KEYWORDS[word] for word in _KEYWORD_RE.findall(text)
+            )
+
+        for category, action, is_trigger in matched:
+            if is_trigger:
+                triggered.add(category)
+            if action:
+                actions.setdefault(category, set()).add(action)
+
+        return triggered, actions
+
     def _handle_system_commands(self, command: str) -> Optional[str]:
         """Handle system-level commands"""
-        command_lower = command.lower()
-        
-        # Camera commands
-        if any(word in command_lower for word in ['câmera', 'camera', 'foto', 'picture']):
-            if 'ligar' in command_lower or 'ativar' in command_lower or 'turn on' in command_lower:
-                self.camera_manager.start_camera()
-                return "Câmera ativada com sucesso."
-            elif 'desligar' in command_lower or 'desativar' in command_lower or 'turn off' in command_lower:
-                self.camera_manager.stop_camera()
-                return "Câmera desativada."
-            elif 'foto' in command_lower or 'picture' in command_lower or 'capturar' in command_lower:
-                filename = self.camera_manager.take_photo()
-                return f"Foto capturada e salva como {filename}."
-        
-        # Volume commands
-        if any(word in command_lower for word in ['volume', 'som']):
-            if 'aumentar' in command_lower or 'increase' in command_lower or 'up' in command_lower:
-                self.system_controller.increase_volume()
-                return "Volume aumentado."
-            elif 'diminuir' in command_lower or 'decrease' in command_lower or 'down' in command_lower:
-                self.system_controller.decrease_volume()
-                return "Volume diminuído."
-            elif 'mudo' in command_lower or 'mute' in command_lower:
-                self.system_controller.mute_volume()
-                return "Som silenciado."
-        
-        # Language change
-        if 'idioma' in command_lower or 'language' in command_lower:
-            if 'inglês' in command_lower or 'english' in command_lower:
-                self.current_language = 'en-US'
-                return "Language changed to English."
-            elif 'português' in command_lower or 'portuguese' in command_lower:
-                self.current_language = 'pt-BR'
-                return "Idioma alterado para português."
-            elif 'espanhol' in command_lower or 'spanish' in command_lower:
-                self.current_language = 'es-ES'
-                return "Idioma cambiado a español."
-        
+        triggered, actions = self._scan_keywords(command.lower())
+
+        if not triggered:
+            return None
+
+        for category, action in _COMMAND_PRIORITY:
+            if category in triggered and action in actions.get(category, ()):
+                return self._command_dispatch[(category, action)]()
+
         return None
+
+    # System command handlers
+    def _cmd_camera_on(self) -> str:
+        self.camera_manager.start_camera()
+        return "Câmera ativada com sucesso."
+
+    def _cmd_camera_off(self) -> str:
+        self.camera_manager.stop_camera()
+        return "Câmera desativada."
+
+    def _cmd_camera_photo(self) -> str:
+        filename = self.camera_manager.take_photo()
+        return f"Foto capturada e salva como {filename}."
+
+    def _cmd_volume_up(self) -> str:
+        self.system_controller.increase_volume()
+        return "Volume aumentado."
+
+    def _cmd_volume_down(self) -> str:
+        self.system_controller.decrease_volume()
+        return "Volume diminuído."
+
+    def _cmd_volume_mute(self) -> str:
+        self.system_controller.mute_volume()
+        return "Som silenciado."
+
+    def _cmd_language_en(self) -> str:
+        self.current_language = 'en-US'
+        return "Language changed to English."
+
+    def _cmd_language_pt(self) -> str:
+        self.current_language = 'pt-BR'
+        return "Idioma alterado para português."
+
+    def _cmd_language_es(self) -> str:
+        self.current_language = 'es-ES'
+        return "Idioma cambiado a español."
     
     def _process_with_ai(self, text: str, language: str) -> str:
         """Process command with AI"""
@@ -245,44 +469,149 @@ class JarvisCore:
             messages = context + [{'role': 'user', 'content': text}]
             
             # Get AI response
-            response = self.ai_client.chat_completion(messages, language)
+            response = self.ai_client.chat_completion(
+                messages, language, cache_key=self.conversation_id
+            )
             return response
             
         except Exception as e:
             self.logger.error(f"AI processing error: {e}")
             return "Desculpe, não consegui processar sua solicitação no momento."
-    
+
+    def _process_with_ai_stream(self, text: str, language: str) -> str:
+        """Process command with AI, speaking sentences as they stream
+
+        Pipelines generation and TTS: completed sentences are handed to
+        a speech worker while the rest of the response is still being
+        generated, so playback hides most of the generation latency.
+        Returns the full response text.
+        """
+        # Prepare context
+        context = self._build_context(language)
+        messages = context + [{'role': 'user', 'content': text}]
+
+        sentence_queue = queue.SimpleQueue()
+
+        def _tts_worker():
+            while True:
+                sentence = sentence_queue.get()
+                if sentence is None:
+                    break
+                self.speak(sentence, language)
+
+        tts_thread = threading.Thread(target=_tts_worker, daemon=True)
+        tts_thread.start()
+
+        chunks = []
+        buffer = ""
+        try:
+            for delta in self.ai_client.chat_completion_stream(
+                messages, language, cache_key=self.conversation_id
+            ):
+                chunks.append(delta)
+                buffer += delta
+
+                # Hand every completed sentence to the speech worker
+                end = _SENTENCE_END_RE.search(buffer)
+                while end:
+                    sentence = buffer[:end.end()].strip()
+                    buffer = buffer[end.end():]
+                    if sentence:
+                        sentence_queue.put(sentence)
+                    end = _SENTENCE_END_RE.search(buffer)
+
+        except Exception as e:
+            self.logger.error(f"AI streaming error: {e}")
+            if not chunks:
+                fallback = "Desculpe, não consegui processar sua solicitação no momento."
+                chunks.append(fallback)
+                buffer = fallback
+
+        finally:
+            # Flush the trailing fragment and wait for speech to finish
+            tail = buffer.strip()
+            if tail:
+                sentence_queue.put(tail)
+            sentence_queue.put(None)
+            tts_thread.join()
+
+        return ''.join(chunks).strip()
+
     def _build_context(self, language: str) -> list:
         """Build conversation context for AI"""
-        # System prompt based on language
-        system_prompts = {
-            'pt-BR': {
-                'role': 'system',
-                'content': 'Você é JARVIS, um assistente virtual inteligente. Seja útil, conciso e amigável. Responda sempre em português brasileiro.'
-            },
-            'en-US': {
-                'role': 'system',
-                'content': 'You are JARVIS, an intelligent virtual assistant. Be helpful, concise and friendly. Always respond in English.'
-            },
-            'es-ES': {
-                'role': 'system',
-                'content': 'Eres JARVIS, un asistente virtual inteligente. Sé útil, conciso y amigable. Responde siempre en español.'
-            }
-        }
-        
-        context = [system_prompts.get(language, system_prompts['pt-BR'])]
-        
-        # Add recent conversation history
-        recent_history = self.conversation_history[-6:] if len(self.conversation_history) > 6 else self.conversation_history
-        
-        for msg in recent_history:
+        context = [_SYSTEM_PROMPTS.get(language, _SYSTEM_PROMPTS['pt-BR'])]
+
+        # Summarized older turns, if any
+        if self.history_summary:
             context.append({
-                'role': msg['role'],
-                'content': msg['content']
+                'role': 'system',
+                'content': f'Resumo da conversa até agora: {self.history_summary}'
             })
-        
+
+        # Serialize the recent window to wire-shape dicts
+        start = max(0, len(self.conversation_history) - 6)
+        context.extend(
+            {'role': m.role, 'content': m.content}
+            for m in islice(
+                self.conversation_history, start, len(self.conversation_history)
+            )
+        )
+
         return context
     
+    def _maybe_summarize_history(self, language: str):
+        """Summarize old turns in the background when history grows"""
+        if not self.ai_client or self._summarizing:
+            return
+
+        if len(self.conversation_history) <= self._summary_threshold:
+            return
+
+        # Pop everything older than the context window
+        old_messages = []
+        while len(self.conversation_history) > 6:
+            old_messages.append(self.conversation_history.popleft())
+
+        self._summarizing = True
+        summarize_thread = threading.Thread(
+            target=self._summarize_history,
+            args=(old_messages, language),
+            daemon=True
+        )
+        summarize_thread.start()
+
+    def _summarize_history(self, messages: list, language: str):
+        """Collapse old conversation turns into the rolling summary"""
+        try:
+            prompt = [{
+                'role': 'system',
+                'content': (
+                    'Resuma a conversa a seguir em poucas frases, '
+                    'preservando fatos e preferências do usuário.'
+                )
+            }]
+
+            if self.history_summary:
+                prompt.append({
+                    'role': 'user',
+                    'content': f'Resumo anterior: {self.history_summary}'
+                })
+
+            for msg in messages:
+                prompt.append({
+                    'role': msg.role,
+                    'content': msg.content
+                })
+
+            self.history_summary = self.ai_client.chat_completion(prompt, language)
+            self.logger.debug("Conversation history summarized")
+
+        except Exception as e:
+            self.logger.error(f"Error summarizing history: {e}")
+
+        finally:
+            self._summarizing = False
+
     def start_listening(self):
         """Start listening for voice commands"""
         if self.is_listening or self.is_speaking:
@@ -290,13 +619,9 @@ class JarvisCore:
         
         self.is_listening = True
         self._trigger_callback('on_status_change', 'listening')
-        
-        # Start listening in a separate thread
-        listening_thread = threading.Thread(
-            target=self._listen_for_command,
-            daemon=True
-        )
-        listening_thread.start()
+
+        # Listen on a pooled worker instead of spawning a new thread
+        self._pool.submit(self._listen_for_command)
     
     def _listen_for_command(self):
         """Listen for voice command"""
@@ -306,8 +631,7 @@ class JarvisCore:
             if command_text:
                 self.command_queue.put({
                     'text': command_text,
-                    'language': self.current_language,
-                    'timestamp': datetime.now()
+                    'language': self.current_language
                 })
         
         except Exception as e:
@@ -317,32 +641,50 @@ class JarvisCore:
             self.is_listening = False
             self._trigger_callback('on_status_change', 'idle')
     
-    def speak(self, text: str, language: str = None):
-        """Speak text using voice synthesis"""
+    def speak(self, text: str, language: str = None, tag: str = None):
+        """Speak text using voice synthesis
+
+        tag identifies the message source; silent tags (e.g. 'System')
+        are dropped by the speech engine before any synthesis work.
+        """
         if not text:
             return
-        
+
         language = language or self.current_language
-        
+
         self.is_speaking = True
+        self._enter_busy()
         self._trigger_callback('on_status_change', 'speaking')
-        
+
         try:
-            self.speech_engine.speak(text, language)
+            self.speech_engine.speak(text, language, tag=tag)
         except Exception as e:
             self.logger.error(f"Error speaking: {e}")
         finally:
             self.is_speaking = False
+            self._exit_busy()
             self._trigger_callback('on_status_change', 'idle')
     
     def add_callback(self, event: str, callback: Callable):
         """Add event callback"""
         if event in self.callbacks:
             self.callbacks[event].append(callback)
-    
+            self._cb_cache[event] = tuple(self.callbacks[event])
+
     def _trigger_callback(self, event: str, data: Any = None):
         """Trigger event callbacks"""
-        for callback in self.callbacks.get(event, []):
+        # Coalesce repeated status transitions (e.g. double 'idle' when
+        # speak finishes inside _process_command)
+        if event == 'on_status_change':
+            if data == self._last_status:
+                return
+            self._last_status = data
+
+        callbacks = self._cb_cache.get(event)
+        if not callbacks:
+            return
+
+        for callback in callbacks:
             try:
                 callback(data)
             except Exception as e:
@@ -373,6 +715,11 @@ class JarvisCore:
             
             if self.recognition_engine:
                 self.recognition_engine.stop()
-                
+
+            if self.ai_client:
+                self.ai_client.close()
+
+            self._pool.shutdown(wait=False)
+
         except Exception as e:
             self.logger.error(f"Error during shutdown: {e}")
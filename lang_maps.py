@@ -0,0 +1,24 @@
+"""
+Language Code Maps
+Shared locale conversion tables for the speech engines
+"""
+
+from types import MappingProxyType
+
+# Detected language (langdetect) -> our locale codes
+DETECT_TO_LOCALE = MappingProxyType({
+    'pt': 'pt-BR',
+    'en': 'en-US',
+    'es': 'es-ES',
+    'fr': 'fr-FR',
+    'de': 'de-DE'
+})
+
+# Our locale codes -> gTTS language codes
+LOCALE_TO_GTTS = MappingProxyType({
+    'pt-BR': 'pt',
+    'en-US': 'en',
+    'es-ES': 'es',
+    'fr-FR': 'fr',
+    'de-DE': 'de'
+})
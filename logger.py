@@ -5,7 +5,12 @@ Configures logging for JARVIS Assistant
 
 import logging
 import os
-from datetime import datetime
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+from collections import deque
+from itertools import islice
 from typing import Optional
 import colorama
 from colorama import Fore, Back, Style
@@ -13,6 +18,9 @@ from colorama import Fore, Back, Style
 # Initialize colorama
 colorama.init(autoreset=True)
 
+# Background listener that drains log records to the file handlers
+_queue_listener: Optional[QueueListener] = None
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for different log levels"""
     
@@ -23,31 +31,59 @@ class ColoredFormatter(logging.Formatter):
         'ERROR': Fore.RED,
         'CRITICAL': Fore.RED + Back.WHITE + Style.BRIGHT
     }
-    
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        # Pre-colored level strings; rebuilding them per record
+        # allocates a fresh f-string on every log line
+        self._level_cache = {
+            level: f"{color}{level}{Style.RESET_ALL}"
+            for level, color in self.COLORS.items()
+        }
+        self._name_cache = {}
+
+        # Skip ANSI codes entirely when output isn't a terminal
+        self._use_color = sys.stderr.isatty()
+
     def format(self, record):
+        if not self._use_color:
+            return super().format(record)
+
+        # Format a copy so other handlers see the uncolored record
+        record = logging.makeLogRecord(record.__dict__)
+
         # Add color to level name
-        level_color = self.COLORS.get(record.levelname, '')
-        record.levelname = f"{level_color}{record.levelname}{Style.RESET_ALL}"
-        
-        # Add color to logger name
-        if 'jarvis' in record.name.lower():
-            record.name = f"{Fore.BLUE}{record.name}{Style.RESET_ALL}"
-        
+        record.levelname = self._level_cache.get(record.levelname, record.levelname)
+
+        # Add color to logger name (memoized per logger)
+        colored_name = self._name_cache.get(record.name)
+        if colored_name is None:
+            if 'jarvis' in record.name.lower():
+                colored_name = f"{Fore.BLUE}{record.name}{Style.RESET_ALL}"
+            else:
+                colored_name = record.name
+            self._name_cache[record.name] = colored_name
+        record.name = colored_name
+
         return super().format(record)
 
 def setup_logger(name: str = 'jarvis', level: str = 'INFO') -> logging.Logger:
     """Setup main logger for JARVIS"""
     
-    # Create logs directory
-    os.makedirs('logs', exist_ok=True)
-    
     # Create logger
     logger = logging.getLogger(name)
+
+    # Already configured (re-entry, tests): reuse as-is instead of
+    # reopening file handles and duplicating records
+    if logger.handlers:
+        return logger
+
     logger.setLevel(getattr(logging, level.upper()))
-    
-    # Clear existing handlers
-    logger.handlers.clear()
-    
+
+    # Create logs directory
+    os.makedirs('logs', exist_ok=True)
+
     # Console handler with colors
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
@@ -58,28 +94,46 @@ def setup_logger(name: str = 'jarvis', level: str = 'INFO') -> logging.Logger:
     )
     console_handler.setFormatter(console_format)
     
-    # File handler for detailed logs
-    log_filename = f"logs/jarvis_{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+    # File handler for detailed logs (rolled over at midnight so a
+    # long-running session isn't pinned to its start date)
+    file_handler = TimedRotatingFileHandler(
+        'logs/jarvis.log', when='midnight', backupCount=14,
+        encoding='utf-8'
+    )
     file_handler.setLevel(logging.DEBUG)
-    
+
     file_format = logging.Formatter(
         fmt='%(asctime)s | %(name)s | %(levelname)s | %(funcName)s:%(lineno)d | %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_format)
-    
+
     # Error file handler
-    error_filename = f"logs/jarvis_errors_{datetime.now().strftime('%Y%m%d')}.log"
-    error_handler = logging.FileHandler(error_filename, encoding='utf-8')
+    error_handler = TimedRotatingFileHandler(
+        'logs/jarvis_errors.log', when='midnight', backupCount=14,
+        encoding='utf-8'
+    )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(file_format)
-    
+
+    # Put the file handlers behind a queue so logging calls from the
+    # voice/camera/AI hot paths never block on disk I/O; a background
+    # listener thread does the actual writes
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+
+    log_queue = queue.SimpleQueue()
+    _queue_listener = QueueListener(
+        log_queue, file_handler, error_handler,
+        respect_handler_level=True
+    )
+    _queue_listener.start()
+
     # Add handlers
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-    logger.addHandler(error_handler)
-    
+    logger.addHandler(QueueHandler(log_queue))
+
     return logger
 
 def get_logger(name: str) -> logging.Logger:
@@ -92,25 +146,33 @@ class JarvisLogHandler(logging.Handler):
     def __init__(self, callback=None):
         super().__init__()
         self.callback = callback
-        self.records = []
         self.max_records = 1000
-    
+        # deque(maxlen=...) evicts old records in O(1) instead of
+        # copying the whole buffer once it fills up
+        self.records = deque(maxlen=self.max_records)
+
     def emit(self, record):
         try:
-            # Store record
+            # Store record (oldest is dropped automatically)
             self.records.append(record)
-            
-            # Keep only recent records
-            if len(self.records) > self.max_records:
-                self.records = self.records[-self.max_records:]
-            
-            # Call callback if provided
+
+            # Call callback with the line already formatted; consumers
+            # (the GUI log panel) then do zero per-record work.
+            # time.strftime is C and much cheaper than going through a
+            # datetime object per record.
             if self.callback:
-                self.callback(record)
-                
+                timestamp = time.strftime(
+                    '%H:%M:%S', time.localtime(record.created)
+                )
+                self.callback(
+                    record.levelname,
+                    f"[{timestamp}] {record.levelname}: {record.getMessage()}\n"
+                )
+
         except Exception:
             self.handleError(record)
-    
+
     def get_recent_logs(self, count: int = 100) -> list:
         """Get recent log records"""
-        return self.records[-count:] if count < len(self.records) else self.records
+        start = max(0, len(self.records) - count)
+        return list(islice(self.records, start, len(self.records)))
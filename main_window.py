@@ -9,7 +9,10 @@ import customtkinter as ctk
 from PIL import Image, ImageTk
 import threading
 import time
+import queue
+from collections import deque
 from datetime import datetime
+import cv2
 import numpy as np
 from typing import Optional, Dict, Any
 
@@ -21,14 +24,99 @@ from utils.logger import get_logger, JarvisLogHandler
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# System-info panel template, built once instead of assembling a
+# 15-line f-string on every refresh
+_SYSINFO_TMPL = """
+System Information:
+
+Platform: {platform}
+Processor: {processor}
+CPU Count: {cpu_count}
+CPU Usage: {cpu_percent:.1f}%
+
+Memory:
+  Total: {memory_total:.1f} GB
+  Used: {memory_used:.1f} GB
+  Available: {memory_available:.1f} GB
+  Usage: {memory_percent:.1f}%
+
+Disk:
+  Total: {disk_total:.1f} GB
+  Used: {disk_used:.1f} GB
+  Free: {disk_free:.1f} GB
+  Usage: {disk_percent:.1f}%
+"""
+
+# Reciprocal so byte fields convert with a multiply, not a division
+_GB = 1.0 / (1024 ** 3)
+
+# Info-dict fields holding raw byte counts
+_BYTE_FIELDS = (
+    'memory_total', 'memory_used', 'memory_available',
+    'disk_total', 'disk_used', 'disk_free'
+)
+
 class JarvisMainWindow:
     """Main JARVIS GUI Window"""
-    
+
+    # Notebook tab order: Chat, Camera, System, Logs, Settings
+    CAMERA_TAB_INDEX = 1
+    SYSTEM_TAB_INDEX = 2
+
     def __init__(self, root: tk.Tk, jarvis_core: JarvisCore):
         self.root = root
         self.jarvis_core = jarvis_core
         self.logger = get_logger(__name__)
-        
+
+        # Pending log lines; flushed to the Text widget in batches so a
+        # burst of records costs one insert instead of one per record
+        self._log_buf = deque(maxlen=1000)
+        self._log_lock = threading.Lock()
+
+        # Events from worker threads, marshaled onto the Tk thread by a
+        # single periodic pump instead of one after(0, ...) per event
+        self._ui_queue = queue.Queue()
+
+        # Latest camera frame (1-slot: the camera thread overwrites,
+        # the GUI renders whatever is newest and drops the rest)
+        self._latest_frame = None
+        self._frame_slot_lock = threading.Lock()
+        self._camera_feed_registered = False
+
+        # Adaptive preview pacing: recent per-frame render times feed
+        # the next after() delay so the feed holds its target FPS
+        # without flooding Tk's event queue on slow machines
+        self._frame_times = deque(maxlen=30)
+        self._target_period = 1.0 / 15
+
+        # Visibility flags: the camera feed, log flush, and animation
+        # freeze to a light probe while the window or tab is hidden
+        self._window_visible = True
+        self._camera_tab_active = False
+
+        # Handles for the periodic after() chains; re-entry cancels the
+        # previous timer instead of stacking a duplicate chain
+        self._status_after_id = None
+        self._time_after_id = None
+        self._anim_after_id = None
+        self._camera_after_id = None
+
+        # Debounce state for the settings sliders, which fire their
+        # command on every pixel of a drag
+        self._rate_after_id = None
+        self._pending_rate = None
+        self._volume_after_id = None
+        self._pending_volume = None
+
+        # Config writes queued from settings callbacks; applied in one
+        # set_many batch after a quiet window
+        self._pending_cfg = {}
+        self._cfg_after_id = None
+
+        # Last system-info snapshot; refreshes are skipped when nothing
+        # changed since the previous render
+        self._last_sys_info = None
+
         # Window configuration
         self.setup_window()
         
@@ -42,7 +130,17 @@ class JarvisMainWindow:
         
         # Start status updates
         self.start_status_updates()
-        
+
+        # Periodic log flush (batches buffered records into the widget)
+        self.root.after(100, self._flush_logs)
+
+        # UI event pump (~30 FPS)
+        self.root.after(33, self._pump_ui_queue)
+
+        # Track window visibility (minimize/restore)
+        self.root.bind('<Map>', self._on_window_map)
+        self.root.bind('<Unmap>', self._on_window_unmap)
+
         # Animation variables
         self.animation_frame = 0
         self.is_animating = False
@@ -88,6 +186,11 @@ class JarvisMainWindow:
         self.header_font = ('Orbitron', 14, 'bold')
         self.normal_font = ('Consolas', 10)
         self.small_font = ('Consolas', 8)
+
+        # Title animation is pure polish on the GUI thread, so it's
+        # opt-in; the color cycle is precomputed once
+        self.animate_title_enabled = config.get('ui.animate_title', False)
+        self._anim_colors = ('#00D4FF', '#0099CC', '#006699', '#003366')
     
     def create_widgets(self):
         """Create GUI widgets"""
@@ -176,6 +279,9 @@ class JarvisMainWindow:
         self.settings_frame = ctk.CTkFrame(self.notebook, fg_color='#111111')
         self.notebook.add(self.settings_frame, text="Settings")
         self.create_settings_interface()
+
+        # Refresh tab-dependent panels only when they become visible
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
     
     def create_chat_interface(self):
         """Create chat interface"""
@@ -197,7 +303,28 @@ class JarvisMainWindow:
             command=self.chat_display.yview
         )
         self.chat_display.configure(yscrollcommand=self.chat_scrollbar.set)
-        
+
+        # Chat tags are configured once here; add_chat_message only
+        # references them, saving several Tcl calls per message
+        self.chat_display.tag_configure('timestamp', foreground='#888888')
+        self._sender_tags = {
+            'You': 'sender_you',
+            'JARVIS': 'sender_jarvis',
+            'System': 'sender_system',
+            'Error': 'sender_error'
+        }
+        sender_colors = {
+            'sender_you': self.accent_color,
+            'sender_jarvis': '#00FF00',
+            'sender_system': '#00FF00',
+            'sender_error': '#FF4444'
+        }
+        for tag, tag_color in sender_colors.items():
+            self.chat_display.tag_configure(
+                tag, foreground=tag_color, font=('Consolas', 10, 'bold')
+            )
+            self.chat_display.tag_configure(tag + '_msg', foreground=tag_color)
+
         # Input frame
         self.input_frame = ctk.CTkFrame(self.chat_frame, fg_color='transparent')
         
@@ -266,6 +393,11 @@ class JarvisMainWindow:
             state='disabled'
         )
         
+        # Persistent preview buffers: one PIL image and one PhotoImage
+        # reused for every frame instead of re-allocated per tick
+        self._cam_pil = Image.new('RGB', (640, 480))
+        self._cam_photo = None
+
         # Camera display
         self.camera_label = ctk.CTkLabel(
             self.camera_frame,
@@ -353,7 +485,19 @@ class JarvisMainWindow:
             command=self.logs_display.yview
         )
         self.logs_display.configure(yscrollcommand=self.logs_scrollbar.set)
-        
+
+        # Configure level tags once; doing it per record crosses the
+        # Tcl boundary on every log line
+        level_colors = {
+            'DEBUG': '#888888',
+            'INFO': '#FFFFFF',
+            'WARNING': '#FFAA00',
+            'ERROR': '#FF4444',
+            'CRITICAL': '#FF0000'
+        }
+        for level, color in level_colors.items():
+            self.logs_display.tag_configure(level, foreground=color)
+
         # Setup log handler
         self.log_handler = JarvisLogHandler(callback=self.add_log_entry)
         get_logger('jarvis').addHandler(self.log_handler)
@@ -460,13 +604,17 @@ class JarvisMainWindow:
             anchor='w'
         )
         
-        # Time display
-        self.time_label = ctk.CTkLabel(
+        # Time display: plain Tk label — a CTkLabel repaints its canvas
+        # on every configure, which is wasteful for a 1 Hz clock
+        self.time_label = tk.Label(
             self.status_frame,
             text="",
-            font=self.small_font
+            font=self.small_font,
+            bg='#111111',
+            fg=self.text_color
         )
-        
+
+        self._last_time_str = ""
         self.update_time()
     
     def create_control_panel(self):
@@ -595,30 +743,82 @@ class JarvisMainWindow:
     
     def start_status_updates(self):
         """Start periodic status updates"""
+        if self._status_after_id is not None:
+            self.root.after_cancel(self._status_after_id)
         self.update_status()
-        self.update_system_info()
-        self.root.after(5000, self.start_status_updates)  # Update every 5 seconds
+        self._status_after_id = self.root.after(5000, self.start_status_updates)
+
+    def _on_window_map(self, event):
+        """Window became visible again"""
+        # <Map> also fires for child widgets; only the toplevel counts
+        if event.widget is self.root:
+            self._window_visible = True
+
+    def _on_window_unmap(self, event):
+        """Window was minimized/hidden"""
+        if event.widget is self.root:
+            self._window_visible = False
+
+    def _on_tab_changed(self, event=None):
+        """Handle notebook tab switches"""
+        selected = self.notebook.index(self.notebook.select())
+        self._camera_tab_active = selected == self.CAMERA_TAB_INDEX
+
+        # System info is only rebuilt when its tab is actually shown
+        # (or via the Refresh button), not on a timer
+        if selected == self.SYSTEM_TAB_INDEX:
+            self.update_system_info()
     
     # Event handlers
+    def _post_ui(self, handler, *args, kind=None):
+        """Queue a handler call for the UI pump (safe from any thread)"""
+        self._ui_queue.put((kind, handler, args))
+
+    def _pump_ui_queue(self):
+        """Drain queued UI events on the Tk thread"""
+        items = []
+        try:
+            while len(items) < 50:
+                items.append(self._ui_queue.get_nowait())
+        except queue.Empty:
+            pass
+
+        if items:
+            # A burst of status transitions collapses to the newest one
+            last_status = -1
+            for i, (kind, _, _) in enumerate(items):
+                if kind == 'status':
+                    last_status = i
+
+            for i, (kind, handler, args) in enumerate(items):
+                if kind == 'status' and i != last_status:
+                    continue
+                try:
+                    handler(*args)
+                except Exception as e:
+                    self.logger.error(f"UI callback error: {e}")
+
+        self.root.after(33, self._pump_ui_queue)
+
     def on_wake_word(self, data):
         """Handle wake word detection"""
-        self.root.after(0, lambda: self.add_chat_message("System", "Wake word detected!", "#00FF00"))
-        self.root.after(0, self.start_listening_animation)
-    
+        self._post_ui(self.add_chat_message, "System", "Wake word detected!", "#00FF00")
+        self._post_ui(self.start_listening_animation)
+
     def on_command(self, data):
         """Handle voice command"""
         command_text = data.get('text', '')
-        self.root.after(0, lambda: self.add_chat_message("You", command_text, self.accent_color))
-    
+        self._post_ui(self.add_chat_message, "You", command_text, self.accent_color)
+
     def on_response(self, data):
         """Handle JARVIS response"""
         response_text = data.get('text', '')
-        self.root.after(0, lambda: self.add_chat_message("JARVIS", response_text, "#00FF00"))
-    
+        self._post_ui(self.add_chat_message, "JARVIS", response_text, "#00FF00")
+
     def on_error(self, error_msg):
         """Handle errors"""
-        self.root.after(0, lambda: self.add_chat_message("Error", str(error_msg), "#FF4444"))
-    
+        self._post_ui(self.add_chat_message, "Error", str(error_msg), "#FF4444")
+
     def on_status_change(self, status):
         """Handle status changes"""
         status_map = {
@@ -627,30 +827,31 @@ class JarvisMainWindow:
             'processing': ('Processing...', '#00AAFF'),
             'speaking': ('Speaking...', '#AA00FF')
         }
-        
+
         text, color = status_map.get(status, ('Unknown', '#FF4444'))
-        self.root.after(0, lambda: self.update_status_indicator(text, color))
+        self._post_ui(self.update_status_indicator, text, color, kind='status')
     
     # GUI Methods
     def add_chat_message(self, sender: str, message: str, color: str = None):
         """Add message to chat display"""
-        if color is None:
-            color = self.text_color
-        
+        tag = self._sender_tags.get(sender, 'sender_system')
+
         timestamp = datetime.now().strftime("%H:%M:%S")
-        
+
         self.chat_display.configure(state=tk.NORMAL)
-        
+
         # Add timestamp and sender
         self.chat_display.insert(tk.END, f"[{timestamp}] ", 'timestamp')
-        self.chat_display.insert(tk.END, f"{sender}: ", 'sender')
-        self.chat_display.insert(tk.END, f"{message}\n\n", 'message')
-        
-        # Configure tags
-        self.chat_display.tag_configure('timestamp', foreground='#888888')
-        self.chat_display.tag_configure('sender', foreground=color, font=('Consolas', 10, 'bold'))
-        self.chat_display.tag_configure('message', foreground=color)
-        
+        self.chat_display.insert(tk.END, f"{sender}: ", tag)
+        self.chat_display.insert(tk.END, f"{message}\n\n", tag + '_msg')
+
+        # Bound the transcript (~500 messages at 2 lines each); line
+        # count comes from Tk index arithmetic, never from pulling the
+        # whole buffer into Python
+        line_count = int(self.chat_display.index('end-1c').split('.')[0])
+        if line_count > 1000:
+            self.chat_display.delete('1.0', f'{line_count - 1000}.0')
+
         self.chat_display.configure(state=tk.DISABLED)
         self.chat_display.see(tk.END)
     
@@ -669,8 +870,7 @@ class JarvisMainWindow:
         threading.Thread(
             target=lambda: self.jarvis_core.command_queue.put({
                 'text': message,
-                'language': self.jarvis_core.current_language,
-                'timestamp': datetime.now()
+                'language': self.jarvis_core.current_language
             }),
             daemon=True
         ).start()
@@ -713,22 +913,69 @@ class JarvisMainWindow:
     
     def start_camera_feed(self):
         """Start camera feed display"""
-        def update_feed():
-            if self.jarvis_core.camera_manager.is_camera_active():
-                frame = self.jarvis_core.camera_manager.get_current_frame()
-                if frame is not None:
-                    # Convert to PhotoImage
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    image = Image.fromarray(frame_rgb)
-                    image = image.resize((640, 480), Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(image)
-                    
-                    self.camera_label.configure(image=photo, text="")
-                    self.camera_label.image = photo  # Keep a reference
-                
-                self.root.after(100, update_feed)
-        
-        update_feed()
+        if not self._camera_feed_registered:
+            self.jarvis_core.camera_manager.add_frame_callback(self._on_camera_frame)
+            self._camera_feed_registered = True
+
+        # Cancel any pending render tick so a quick off/on toggle
+        # can't leave two chains rescheduling forever
+        if self._camera_after_id is not None:
+            self.root.after_cancel(self._camera_after_id)
+            self._camera_after_id = None
+
+        self._update_camera_feed()
+
+    def _on_camera_frame(self, frame):
+        """Receive a frame from the camera thread (overwrites the slot)"""
+        with self._frame_slot_lock:
+            self._latest_frame = frame
+
+    def _update_camera_feed(self):
+        """Render the newest camera frame onto the camera label"""
+        if not self.jarvis_core.camera_manager.is_camera_active():
+            self._camera_after_id = None
+            return
+
+        # Skip all conversion work while the window is minimized or the
+        # Camera tab is hidden; keep only a lightweight probe alive
+        if not (self._window_visible and self._camera_tab_active):
+            self._camera_after_id = self.root.after(500, self._update_camera_feed)
+            return
+
+        t1 = time.perf_counter()
+
+        with self._frame_slot_lock:
+            frame = self._latest_frame
+            self._latest_frame = None
+
+        if frame is not None:
+            # Downscale first with cv2 (C/SIMD) so the RGB conversion
+            # touches the 640x480 preview, not the native resolution
+            small = cv2.resize(frame, (640, 480), interpolation=cv2.INTER_AREA)
+            small_rgb = cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
+
+            # Load into the persistent PIL buffer (no new Image object)
+            self._cam_pil.frombytes(small_rgb.tobytes())
+
+            # Blit when the event loop is idle so redraws coalesce
+            self.root.after_idle(self._blit_camera_photo)
+
+        # Subtract the measured render cost from the target period so
+        # the effective rate stays near target instead of drifting
+        self._frame_times.append(time.perf_counter() - t1)
+        avg = sum(self._frame_times) / len(self._frame_times)
+        delay = max(1, int((self._target_period - avg) * 1000))
+        self._camera_after_id = self.root.after(delay, self._update_camera_feed)
+
+    def _blit_camera_photo(self):
+        """Paste the prepared frame into the persistent PhotoImage"""
+        if self._cam_photo is None:
+            # One Tk image handle for the whole session; pasting into it
+            # avoids churning Tk's image registry every frame
+            self._cam_photo = ImageTk.PhotoImage(image=self._cam_pil)
+            self.camera_label.configure(image=self._cam_photo, text="")
+        else:
+            self._cam_photo.paste(self._cam_pil)
     
     def take_photo(self):
         """Take photo with camera"""
@@ -742,28 +989,26 @@ class JarvisMainWindow:
         """Update system information display"""
         try:
             info = self.jarvis_core.system_controller.get_system_info()
-            
-            info_text = f"""
-System Information:
 
-Platform: {info.get('platform', 'Unknown')}
-Processor: {info.get('processor', 'Unknown')}
-CPU Count: {info.get('cpu_count', 'Unknown')}
-CPU Usage: {info.get('cpu_percent', 0):.1f}%
+            # Nothing changed since the last render: skip the rebuild
+            if info == self._last_sys_info:
+                return
+            self._last_sys_info = dict(info)
+
+            fields = {
+                'platform': info.get('platform', 'Unknown'),
+                'processor': info.get('processor', 'Unknown'),
+                'cpu_count': info.get('cpu_count', 'Unknown'),
+                'cpu_percent': info.get('cpu_percent', 0),
+                'memory_percent': info.get('memory_percent', 0),
+                'disk_percent': info.get('disk_percent', 0)
+            }
+            for key in _BYTE_FIELDS:
+                fields[key] = info.get(key, 0) * _GB
+
+            info_text = _SYSINFO_TMPL.format(**fields)
 
-Memory:
-  Total: {info.get('memory_total', 0) / (1024**3):.1f} GB
-  Used: {info.get('memory_used', 0) / (1024**3):.1f} GB
-  Available: {info.get('memory_available', 0) / (1024**3):.1f} GB
-  Usage: {info.get('memory_percent', 0):.1f}%
 
-Disk:
-  Total: {info.get('disk_total', 0) / (1024**3):.1f} GB
-  Used: {info.get('disk_used', 0) / (1024**3):.1f} GB
-  Free: {info.get('disk_free', 0) / (1024**3):.1f} GB
-  Usage: {info.get('disk_percent', 0):.1f}%
-"""
-            
             self.system_info.configure(state=tk.NORMAL)
             self.system_info.delete(1.0, tk.END)
             self.system_info.insert(tk.END, info_text)
@@ -772,53 +1017,49 @@ Disk:
         except Exception as e:
             self.logger.error(f"Error updating system info: {e}")
     
-    def add_log_entry(self, record):
-        """Add log entry to logs display"""
-        try:
-            timestamp = datetime.fromtimestamp(record.created).strftime("%H:%M:%S")
-            level = record.levelname
-            message = record.getMessage()
-            
-            log_text = f"[{timestamp}] {level}: {message}\n"
-            
-            self.root.after(0, lambda: self._add_log_text(log_text, level))
-        except Exception as e:
-            pass  # Ignore logging errors to prevent recursion
-    
-    def _add_log_text(self, text: str, level: str):
-        """Add text to logs display"""
-        try:
+    def add_log_entry(self, level, text):
+        """Buffer a pre-formatted log line for the periodic flush
+
+        Formatting happens in JarvisLogHandler.emit; since nothing here
+        can log, the old recursion-guarding try/except is unnecessary.
+        """
+        with self._log_lock:
+            self._log_buf.append((level, text))
+
+    def _flush_logs(self):
+        """Flush buffered log records into the display in one pass"""
+        # While hidden, let lines accumulate (the deque is bounded)
+        if not self._window_visible:
+            self.root.after(500, self._flush_logs)
+            return
+
+        with self._log_lock:
+            entries = list(self._log_buf)
+            self._log_buf.clear()
+
+        if entries:
             self.logs_display.configure(state=tk.NORMAL)
-            self.logs_display.insert(tk.END, text)
-            
-            # Color coding
-            colors = {
-                'DEBUG': '#888888',
-                'INFO': '#FFFFFF',
-                'WARNING': '#FFAA00',
-                'ERROR': '#FF4444',
-                'CRITICAL': '#FF0000'
-            }
-            
-            color = colors.get(level, '#FFFFFF')
-            start = self.logs_display.index("end-2l")
-            end = self.logs_display.index("end-1l")
-            
-            self.logs_display.tag_add(level, start, end)
-            self.logs_display.tag_configure(level, foreground=color)
-            
+
+            # Group consecutive same-level lines into single inserts
+            group_level, group_lines = entries[0][0], []
+            for level, text in entries:
+                if level != group_level:
+                    self.logs_display.insert(tk.END, ''.join(group_lines), group_level)
+                    group_level, group_lines = level, []
+                group_lines.append(text)
+            self.logs_display.insert(tk.END, ''.join(group_lines), group_level)
+
+            # Trim via Tk index arithmetic instead of round-tripping the
+            # whole buffer to Python just to count lines
+            line_count = int(self.logs_display.index('end-1c').split('.')[0])
+            if line_count > 1000:
+                self.logs_display.delete('1.0', f'{line_count - 1000}.0')
+
             self.logs_display.configure(state=tk.DISABLED)
             self.logs_display.see(tk.END)
-            
-            # Keep only last 1000 lines
-            lines = self.logs_display.get(1.0, tk.END).split('\n')
-            if len(lines) > 1000:
-                self.logs_display.configure(state=tk.NORMAL)
-                self.logs_display.delete(1.0, f"{len(lines)-1000}.0")
-                self.logs_display.configure(state=tk.DISABLED)
-        except Exception:
-            pass
-    
+
+        self.root.after(100, self._flush_logs)
+
     def update_status_indicator(self, text: str, color: str):
         """Update status indicator"""
         self.status_text.configure(text=text)
@@ -843,29 +1084,47 @@ Disk:
     def update_time(self):
         """Update time display"""
         current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.time_label.configure(text=current_time)
-        self.root.after(1000, self.update_time)
+        # Only touch the widget when the text actually changed
+        if current_time != self._last_time_str:
+            self._last_time_str = current_time
+            self.time_label.configure(text=current_time)
+        if self._time_after_id is not None:
+            self.root.after_cancel(self._time_after_id)
+        self._time_after_id = self.root.after(1000, self.update_time)
     
     def start_listening_animation(self):
         """Start listening animation"""
+        if not self.animate_title_enabled or self.is_animating:
+            return
         self.is_animating = True
         self.animate_title()
-    
+
     def animate_title(self):
         """Animate title during listening"""
         if not self.is_animating:
             return
-        
-        colors = ['#00D4FF', '#0099CC', '#006699', '#003366']
-        color = colors[self.animation_frame % len(colors)]
-        
+
+        # Pause (don't stop) while the window is hidden
+        if not self._window_visible:
+            if self._anim_after_id is not None:
+                self.root.after_cancel(self._anim_after_id)
+            self._anim_after_id = self.root.after(500, self.animate_title)
+            return
+
+        color = self._anim_colors[self.animation_frame % len(self._anim_colors)]
+
         self.title_label.configure(text_color=color)
         self.animation_frame += 1
-        
+
         if self.jarvis_core.is_listening or self.jarvis_core.is_processing:
-            self.root.after(200, self.animate_title)
+            # 8 Hz is plenty for a color cycle; each tick repaints the
+            # CTkLabel canvas
+            if self._anim_after_id is not None:
+                self.root.after_cancel(self._anim_after_id)
+            self._anim_after_id = self.root.after(125, self.animate_title)
         else:
             self.is_animating = False
+            self._anim_after_id = None
             self.title_label.configure(text_color=self.accent_color)
     
     # Settings methods
@@ -879,10 +1138,15 @@ Disk:
             config.set('openrouter.model', model)
             config.save_user_config()
             
-            # Reinitialize AI client
+            # Rotate credentials on the existing client so its pooled
+            # connections survive; only build a fresh one when the app
+            # started without an AI client at all
             try:
-                from ai.openrouter_client import OpenRouterClient
-                self.jarvis_core.ai_client = OpenRouterClient()
+                if self.jarvis_core.ai_client:
+                    self.jarvis_core.ai_client.update_credentials(api_key, model)
+                else:
+                    from ai.openrouter_client import OpenRouterClient
+                    self.jarvis_core.ai_client = OpenRouterClient()
                 messagebox.showinfo("Success", "API settings saved successfully!")
                 
                 # Test connection
@@ -906,22 +1170,52 @@ Disk:
                 self.logger.error(f"API connection test error: {e}")
     
     def update_speech_rate(self, value):
-        """Update speech rate"""
-        rate = int(float(value))
+        """Debounce speech-rate slider drags"""
+        self._pending_rate = value
+        if self._rate_after_id is not None:
+            self.root.after_cancel(self._rate_after_id)
+        self._rate_after_id = self.root.after(150, self._commit_rate)
+
+    def _queue_cfg(self, key, value):
+        """Queue a config write; a burst flushes as one batch"""
+        self._pending_cfg[key] = value
+        if self._cfg_after_id is not None:
+            self.root.after_cancel(self._cfg_after_id)
+        self._cfg_after_id = self.root.after(250, self._flush_cfg)
+
+    def _flush_cfg(self):
+        """Apply all queued config writes in one set_many call"""
+        self._cfg_after_id = None
+        if self._pending_cfg:
+            config.set_many(self._pending_cfg)
+            self._pending_cfg = {}
+
+    def _commit_rate(self):
+        """Apply the last slider value once the drag settles"""
+        self._rate_after_id = None
+        rate = int(float(self._pending_rate))
         self.jarvis_core.speech_engine.set_rate(rate)
-        config.set('voice.rate', rate)
-    
+        self._queue_cfg('voice.rate', rate)
+
     def update_voice_volume(self, value):
-        """Update voice volume"""
-        volume = float(value)
+        """Debounce voice-volume slider drags"""
+        self._pending_volume = value
+        if self._volume_after_id is not None:
+            self.root.after_cancel(self._volume_after_id)
+        self._volume_after_id = self.root.after(150, self._commit_volume)
+
+    def _commit_volume(self):
+        """Apply the last slider value once the drag settles"""
+        self._volume_after_id = None
+        volume = float(self._pending_volume)
         self.jarvis_core.speech_engine.set_volume(volume)
-        config.set('voice.volume', volume)
+        self._queue_cfg('voice.volume', volume)
     
     def update_language(self, language):
         """Update language setting"""
         self.jarvis_core.current_language = language
         self.jarvis_core.recognition_engine.set_language(language)
-        config.set('languages.default', language)
+        self._queue_cfg('languages.default', language)
     
     # Control methods
     def emergency_stop(self):
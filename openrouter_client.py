@@ -5,10 +5,22 @@ Handles AI interactions using OpenRouter API
 
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict, Any, Optional
 from config.config import config
 from utils.logger import get_logger
 
+# Canned per-language error replies; built once instead of on every
+# failed request
+_FALLBACK_RESPONSES = {
+    'pt-BR': "Desculpe, estou com dificuldades para processar sua solicitação no momento. Tente novamente em alguns instantes.",
+    'en-US': "Sorry, I'm having trouble processing your request right now. Please try again in a moment.",
+    'es-ES': "Lo siento, tengo problemas para procesar tu solicitud en este momento. Inténtalo de nuevo en unos momentos.",
+    'fr-FR': "Désolé, j'ai des difficultés à traiter votre demande en ce moment. Veuillez réessayer dans quelques instants.",
+    'de-DE': "Entschuldigung, ich habe gerade Schwierigkeiten, Ihre Anfrage zu bearbeiten. Versuchen Sie es in einem Moment noch einmal."
+}
+
 class OpenRouterClient:
     """OpenRouter API client for AI interactions"""
     
@@ -28,8 +40,28 @@ class OpenRouterClient:
             "HTTP-Referer": "https://github.com/jarvis-assistant",
             "X-Title": "JARVIS Assistant"
         }
-    
-    def chat_completion(self, messages: List[Dict[str, str]], language: str = "pt-BR") -> str:
+
+        # One pooled session for every call: HTTP keep-alive skips the
+        # TCP and TLS handshakes after the first request, and transient
+        # gateway errors retry with backoff instead of surfacing
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        # POST is retried too: chat completions are safe to reissue on
+        # gateway errors and 429s, and Retry-After is honored so bursts
+        # back off instead of surfacing fallback strings to the user
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(['GET', 'POST']),
+            respect_retry_after_header=True
+        )
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=2, pool_maxsize=8, max_retries=retries
+        ))
+
+    def chat_completion(self, messages: List[Dict[str, str]], language: str = "pt-BR",
+                        cache_key: Optional[str] = None) -> str:
         """Get chat completion from OpenRouter"""
         try:
             # Prepare the request payload
@@ -40,15 +72,21 @@ class OpenRouterClient:
                 "temperature": 0.7,
                 "stream": False
             }
-            
+
+            if cache_key:
+                # A stable per-conversation key plus a cache breakpoint
+                # on the unchanged prefix lets providers reuse their
+                # KV/prompt cache instead of re-prefilling the history
+                payload["user"] = cache_key
+                payload["messages"] = self._mark_cache_breakpoint(messages)
+
             # Make the API request
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/chat/completions",
-                headers=self.headers,
                 json=payload,
-                timeout=30
+                timeout=(3.05, 30)
             )
-            
+
             response.raise_for_status()
             
             # Parse the response
@@ -72,17 +110,111 @@ class OpenRouterClient:
             self.logger.error(f"Unexpected error: {e}")
             return self._get_fallback_response(language)
     
+    def chat_completion_stream(self, messages: List[Dict[str, str]],
+                               language: str = "pt-BR",
+                               cache_key: Optional[str] = None):
+        """Stream chat completion text deltas from OpenRouter
+
+        Yields content fragments as they arrive so callers can start
+        acting on the answer (e.g. speaking it) before generation
+        finishes. On error the fallback response is yielded whole.
+        """
+        try:
+            # Prepare the request payload
+            payload = {
+                "model": self.model,
+                "messages": messages,
+                "max_tokens": self.max_tokens,
+                "temperature": 0.7,
+                "stream": True
+            }
+
+            if cache_key:
+                payload["user"] = cache_key
+                payload["messages"] = self._mark_cache_breakpoint(messages)
+
+            with self._session.post(
+                f"{self.base_url}/chat/completions",
+                json=payload,
+                timeout=(3.05, 60),
+                stream=True
+            ) as response:
+                response.raise_for_status()
+
+                # Parse the SSE event stream
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+
+                    line = line.decode('utf-8')
+                    if not line.startswith('data: '):
+                        continue
+
+                    data = line[6:]
+                    if data == '[DONE]':
+                        break
+
+                    try:
+                        chunk = json.loads(data)
+                    except json.JSONDecodeError:
+                        continue
+
+                    choices = chunk.get('choices')
+                    if not choices:
+                        continue
+
+                    delta = choices[0].get('delta', {}).get('content')
+                    if delta:
+                        yield delta
+
+        except requests.exceptions.RequestException as e:
+            self.logger.error(f"API streaming error: {e}")
+            yield self._get_fallback_response(language)
+
+        except Exception as e:
+            self.logger.error(f"Unexpected streaming error: {e}")
+            yield self._get_fallback_response(language)
+
+    @staticmethod
+    def _mark_cache_breakpoint(messages: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        """Mark the last stable prefix message as a cache breakpoint
+
+        cache_control must live inside a content part, and providers
+        accept only a handful of breakpoints per request, so exactly
+        one goes on the newest message before the final (new) one —
+        the prefix up to that point is what a cache hit matches.
+        """
+        if len(messages) < 2:
+            return list(messages)
+
+        msgs = list(messages)
+        tail = dict(msgs[-2])
+        tail["content"] = [{
+            "type": "text",
+            "text": tail["content"],
+            "cache_control": {"type": "ephemeral"}
+        }]
+        msgs[-2] = tail
+        return msgs
+
+    def update_credentials(self, api_key: str, model: str):
+        """Swap API key and model without dropping the pooled session
+
+        Rebuilding the client on a settings change would throw away the
+        warm keep-alive connections; mutating the session headers keeps
+        them.
+        """
+        if not api_key:
+            raise ValueError("OpenRouter API key must not be empty")
+
+        self.api_key = api_key
+        self.model = model
+        self._session.headers['Authorization'] = f"Bearer {api_key}"
+        self.logger.info(f"OpenRouter credentials updated (model: {model})")
+
     def _get_fallback_response(self, language: str) -> str:
         """Get fallback response when AI is unavailable"""
-        fallback_responses = {
-            'pt-BR': "Desculpe, estou com dificuldades para processar sua solicitação no momento. Tente novamente em alguns instantes.",
-            'en-US': "Sorry, I'm having trouble processing your request right now. Please try again in a moment.",
-            'es-ES': "Lo siento, tengo problemas para procesar tu solicitud en este momento. Inténtalo de nuevo en unos momentos.",
-            'fr-FR': "Désolé, j'ai des difficultés à traiter votre demande en ce moment. Veuillez réessayer dans quelques instants.",
-            'de-DE': "Entschuldigung, ich habe gerade Schwierigkeiten, Ihre Anfrage zu bearbeiten. Versuchen Sie es in einem Moment noch einmal."
-        }
-        
-        return fallback_responses.get(language, fallback_responses['en-US'])
+        return _FALLBACK_RESPONSES.get(language, _FALLBACK_RESPONSES['en-US'])
     
     def test_connection(self) -> bool:
         """Test the API connection"""
@@ -102,10 +234,9 @@ class OpenRouterClient:
     def get_available_models(self) -> List[str]:
         """Get list of available models"""
         try:
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/models",
-                headers=self.headers,
-                timeout=10
+                timeout=(3.05, 10)
             )
             
             response.raise_for_status()
@@ -119,3 +250,7 @@ class OpenRouterClient:
         except Exception as e:
             self.logger.error(f"Error getting models: {e}")
             return []
+
+    def close(self):
+        """Close the pooled HTTP session"""
+        self._session.close()
@@ -4,12 +4,14 @@ Handles text-to-speech synthesis with robotic voice effects
 """
 
 import pyttsx3
+import hashlib
+import os
+import queue
+import re
 import threading
 import time
-from typing import Optional
-import numpy as np
-import io
 from config.config import config
+from utils.lang_maps import LOCALE_TO_GTTS
 from utils.logger import get_logger
 
 try:
@@ -19,6 +21,33 @@ try:
 except ImportError:
     GTTS_AVAILABLE = False
 
+try:
+    import sounddevice as sd
+    from pydub import AudioSegment
+    SOUNDDEVICE_AVAILABLE = True
+except ImportError:
+    SOUNDDEVICE_AVAILABLE = False
+
+# Disk cache for synthesized gTTS clips, keyed by language and text;
+# repeated phrases skip the network round-trip entirely
+_TTS_CACHE_DIR = os.path.expanduser('~/.cache/jarvis/tts')
+_TTS_CACHE_MAX_BYTES = 100 * 1024 * 1024
+_TTS_CACHE_MAX_AGE = 30 * 24 * 3600
+
+# Precompiled robotic-effect patterns: one pass for pauses and one for
+# emphasis instead of nine full-string replace() scans per utterance
+_PAUSE_RE = re.compile(r'([.!?])|,')
+
+# Message tags that never get read aloud (status echoes the user
+# already sees in the chat log); checked before any TTS work happens
+_SILENT_TAGS = frozenset({'System', 'Debug'})
+_EMPHASIS_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, (
+        'jarvis', 'sistema', 'ativado', 'processando', 'comando'
+    ))) + r')\b',
+    re.IGNORECASE
+)
+
 class SpeechEngine:
     """Speech synthesis engine with robotic voice effects"""
     
@@ -27,10 +56,18 @@ class SpeechEngine:
         self.engine_type = config.get('voice.engine', 'pyttsx3')
         self.is_speaking = False
         self.speech_lock = threading.Lock()
-        
-        # Initialize speech engine
-        self._init_engine()
-    
+
+        # Utterances queued for the pyttsx3 worker; each entry carries
+        # a done event so speak() can block until playback actually
+        # finishes while the worker owns the driver
+        self._tts_queue = queue.Queue()
+
+        # Driver startup (voice enumeration, mixer init) runs on a
+        # background thread so construction returns immediately;
+        # speak() waits on this event before touching the engine
+        self._engine_ready = threading.Event()
+        threading.Thread(target=self._init_engine, daemon=True).start()
+
     def _init_engine(self):
         """Initialize the speech engine"""
         try:
@@ -41,10 +78,13 @@ class SpeechEngine:
             else:
                 self.logger.warning("Falling back to pyttsx3")
                 self._init_pyttsx3()
-                
+
+            self._engine_ready.set()
+
         except Exception as e:
+            # Leave the ready event unset so speak() times out instead
+            # of touching a half-initialized engine
             self.logger.error(f"Error initializing speech engine: {e}")
-            raise
     
     def _init_pyttsx3(self):
         """Initialize pyttsx3 engine"""
@@ -63,78 +103,173 @@ class SpeechEngine:
         voices = self.engine.getProperty('voices')
         if voices and len(voices) > voice_id:
             self.engine.setProperty('voice', voices[voice_id].id)
-        
+
+        # Pump the driver from a dedicated worker: startLoop(False) plus
+        # iterate() lets the next utterance queue up while the current
+        # one is still playing, and callers never block on runAndWait
+        self.engine.startLoop(False)
+        self._tts_thread = threading.Thread(target=self._tts_worker, daemon=True)
+        self._tts_thread.start()
+
         self.logger.info("pyttsx3 engine initialized")
     
     def _init_gtts(self):
         """Initialize gTTS engine"""
         if GTTS_AVAILABLE:
+            os.makedirs(_TTS_CACHE_DIR, exist_ok=True)
+            self._prune_tts_cache()
+
+            if SOUNDDEVICE_AVAILABLE:
+                # Straight into PortAudio via sounddevice: no SDL mixer
+                # to initialize and no decode stall inside pygame
+                self.logger.info("gTTS engine initialized (sounddevice)")
+                return
+
             pygame.mixer.init()
+
+            # End-of-track notification instead of get_busy() polling:
+            # pygame posts an event when playback finishes and a pump
+            # thread flips this threading.Event. pygame.event needs
+            # the display subsystem, so bring it up on the dummy
+            # driver; if that fails, playback falls back to polling
+            self._music_end = threading.Event()
+            try:
+                os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+                pygame.display.init()
+                pygame.mixer.music.set_endevent(pygame.USEREVENT + 1)
+                threading.Thread(target=self._pygame_event_pump, daemon=True).start()
+            except Exception as e:
+                self.logger.debug(f"pygame event pump unavailable: {e}")
+
             self.logger.info("gTTS engine initialized")
         else:
             raise ImportError("gTTS not available")
+
+    def _pygame_event_pump(self):
+        """Translate pygame's end-of-track event into a threading.Event"""
+        while True:
+            try:
+                event = pygame.event.wait()
+                if event.type == pygame.USEREVENT + 1:
+                    self._music_end.set()
+            except Exception:
+                time.sleep(0.1)
+
+    def _prune_tts_cache(self):
+        """Drop cached clips that are old or over the size budget"""
+        try:
+            entries = []
+            now = time.time()
+            for name in os.listdir(_TTS_CACHE_DIR):
+                path = os.path.join(_TTS_CACHE_DIR, name)
+                st = os.stat(path)
+                if now - st.st_mtime > _TTS_CACHE_MAX_AGE:
+                    os.remove(path)
+                else:
+                    entries.append((st.st_mtime, st.st_size, path))
+
+            # Evict oldest-first until under the size cap
+            total = sum(size for _, size, _ in entries)
+            if total > _TTS_CACHE_MAX_BYTES:
+                entries.sort()
+                for _, size, path in entries:
+                    os.remove(path)
+                    total -= size
+                    if total <= _TTS_CACHE_MAX_BYTES:
+                        break
+
+        except Exception as e:
+            self.logger.debug(f"TTS cache cleanup error: {e}")
     
-    def speak(self, text: str, language: str = None):
-        """Speak text with robotic voice effects"""
-        if not text:
+    def speak(self, text: str, language: str = None, tag: str = None):
+        """Speak text with robotic voice effects
+
+        Messages tagged with a silent tag (UI status echoes) skip the
+        pipeline entirely.
+        """
+        if not text or text.isspace():
             return
-        
+
+        if tag in _SILENT_TAGS:
+            return
+
+        if not self._engine_ready.wait(timeout=5):
+            self.logger.warning("Speech engine not ready, dropping utterance")
+            return
+
+        # Pauses apply to every backend; SSML emphasis only helps gTTS
+        # (pyttsx3 ignores the tags, so that pass would be wasted work)
+        processed_text = self._add_pauses(text)
+
+        if self.engine_type == 'pyttsx3':
+            # The worker serializes utterances, but speak() must not
+            # return before playback ends: callers tie their busy
+            # window (and the wake-word pause) to this call, and
+            # releasing it early lets the listener hear our own voice
+            done = threading.Event()
+            self._tts_queue.put((processed_text, done))
+            done.wait()
+            return
+
         with self.speech_lock:
             if self.is_speaking:
                 return
-            
+
             self.is_speaking = True
-        
+
         try:
-            # Apply robotic text preprocessing
-            processed_text = self._apply_robotic_effects(text)
-            
-            if self.engine_type == 'pyttsx3':
-                self._speak_pyttsx3(processed_text)
-            elif self.engine_type == 'gtts' and GTTS_AVAILABLE:
-                self._speak_gtts(processed_text, language)
-            
+            if self.engine_type == 'gtts' and GTTS_AVAILABLE:
+                self._speak_gtts(self._add_emphasis_ssml(processed_text), language)
+
         except Exception as e:
             self.logger.error(f"Error speaking: {e}")
-        
+
         finally:
             self.is_speaking = False
     
-    def _apply_robotic_effects(self, text: str) -> str:
-        """Apply robotic speech effects to text"""
-        # Add pauses for robotic effect
-        robotic_text = text.replace('.', '... ')
-        robotic_text = robotic_text.replace(',', ',. ')
-        robotic_text = robotic_text.replace('!', '... ')
-        robotic_text = robotic_text.replace('?', '... ')
-        
-        # Add emphasis on certain words
-        emphasis_words = ['jarvis', 'sistema', 'ativado', 'processando', 'comando']
-        for word in emphasis_words:
-            if word in robotic_text.lower():
-                robotic_text = robotic_text.replace(
-                    word, f"<emphasis level='strong'>{word}</emphasis>"
-                )
-        
-        return robotic_text
+    def _add_pauses(self, text: str) -> str:
+        """Insert robotic pauses at punctuation (single pass)"""
+        return _PAUSE_RE.sub(
+            lambda m: '... ' if m.group(1) else ',. ', text
+        )
+
+    def _add_emphasis_ssml(self, text: str) -> str:
+        """Wrap emphasis words in SSML tags (gTTS only)"""
+        return _EMPHASIS_RE.sub(
+            r"<emphasis level='strong'>\1</emphasis>", text
+        )
     
-    def _speak_pyttsx3(self, text: str):
-        """Speak using pyttsx3"""
-        try:
-            # Apply robotic voice settings
-            original_rate = self.engine.getProperty('rate')
-            
-            # Slightly slower for robotic effect
-            self.engine.setProperty('rate', original_rate * 0.8)
-            
-            self.engine.say(text)
-            self.engine.runAndWait()
-            
-            # Restore original rate
-            self.engine.setProperty('rate', original_rate)
-            
-        except Exception as e:
-            self.logger.error(f"Error with pyttsx3 speech: {e}")
+    def _tts_worker(self):
+        """Drain queued utterances through the pyttsx3 driver"""
+        while True:
+            text, done = self._tts_queue.get()
+
+            try:
+                with self.speech_lock:
+                    self.is_speaking = True
+
+                # Apply robotic voice settings
+                original_rate = self.engine.getProperty('rate')
+
+                # Slightly slower for robotic effect
+                self.engine.setProperty('rate', original_rate * 0.8)
+
+                self.engine.say(text)
+                while self.engine.isBusy():
+                    self.engine.iterate()
+                    time.sleep(0.01)
+
+                # Restore original rate
+                self.engine.setProperty('rate', original_rate)
+
+            except Exception as e:
+                self.logger.error(f"Error with pyttsx3 speech: {e}")
+
+            finally:
+                done.set()
+                if self._tts_queue.empty():
+                    with self.speech_lock:
+                        self.is_speaking = False
     
     def _speak_gtts(self, text: str, language: str = None):
         """Speak using gTTS"""
@@ -143,31 +278,50 @@ class SpeechEngine:
         
         try:
             # Convert language code
-            lang_map = {
-                'pt-BR': 'pt',
-                'en-US': 'en',
-                'es-ES': 'es',
-                'fr-FR': 'fr',
-                'de-DE': 'de'
-            }
-            
-            lang = lang_map.get(language, 'pt')
-            
-            # Generate speech
-            tts = gTTS(text=text, lang=lang, slow=True)  # slow=True for robotic effect
-            
-            # Save to memory buffer
-            fp = io.BytesIO()
-            tts.write_to_fp(fp)
-            fp.seek(0)
-            
+            lang = LOCALE_TO_GTTS.get(language, 'pt')
+
+            # Cache hit: play the stored clip without any synthesis
+            key = hashlib.sha1(f"{lang}:{text}".encode()).hexdigest()
+            clip_path = os.path.join(_TTS_CACHE_DIR, f"{key}.mp3")
+
+            if not os.path.exists(clip_path):
+                # Generate speech, streamed chunk by chunk straight to
+                # the cache file so the MP3 is never held in memory and
+                # the disk write overlaps the download; the temp name
+                # keeps aborted downloads out of the cache
+                tts = gTTS(text=text, lang=lang, slow=True)  # slow=True for robotic effect
+                tmp_path = clip_path + '.part'
+                with open(tmp_path, 'wb') as f:
+                    for chunk in tts.stream():
+                        f.write(chunk)
+                os.replace(tmp_path, clip_path)
+
+            if SOUNDDEVICE_AVAILABLE:
+                # Decode once with pydub and hand the int16 buffer to
+                # PortAudio directly; numpy is only needed here, so it
+                # stays out of module import time
+                import numpy as np
+
+                seg = AudioSegment.from_mp3(clip_path)
+                samples = np.frombuffer(seg.raw_data, dtype=np.int16)
+                if seg.channels > 1:
+                    samples = samples.reshape((-1, seg.channels))
+                sd.play(samples, seg.frame_rate)
+                sd.wait()
+                return
+
             # Play audio
-            pygame.mixer.music.load(fp)
+            self._music_end.clear()
+            pygame.mixer.music.load(clip_path)
             pygame.mixer.music.play()
-            
-            # Wait for playback to finish
+
+            # Wait for playback to finish: the end event wakes us
+            # promptly when the pump is running, and the get_busy()
+            # check backstops it when the event subsystem isn't
+            # available so we never sit out a long timeout
             while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
+                if self._music_end.wait(timeout=0.1):
+                    break
                 
         except Exception as e:
             self.logger.error(f"Error with gTTS speech: {e}")
@@ -178,7 +332,10 @@ class SpeechEngine:
             if self.engine_type == 'pyttsx3' and hasattr(self, 'engine'):
                 self.engine.stop()
             elif self.engine_type == 'gtts' and GTTS_AVAILABLE:
-                pygame.mixer.music.stop()
+                if SOUNDDEVICE_AVAILABLE:
+                    sd.stop()
+                else:
+                    pygame.mixer.music.stop()
                 
         except Exception as e:
             self.logger.error(f"Error stopping speech: {e}")
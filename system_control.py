@@ -3,112 +3,280 @@ System Controller Module
 Handles system automation and control
 """
 
+import heapq
 import os
+import signal
 import sys
 import subprocess
 import psutil
-import pyautogui
-import webbrowser
 from typing import Dict, Any, List, Optional
 import platform
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import quote_plus
 
 from config.config import config
 from utils.logger import get_logger
 
+try:
+    import mss
+    MSS_AVAILABLE = True
+except ImportError:
+    MSS_AVAILABLE = False
+
+_SCREENSHOT_DIR = 'output/screenshots'
+
+# URL schemes accepted as-is by open_website; everything else gets
+# https:// prepended
+_SCHEMES = ('http://', 'https://')
+
+# Search-engine endpoints; built once instead of per search_web call
+_SEARCH_URLS = {
+    'google': 'https://www.google.com/search?q=',
+    'bing': 'https://www.bing.com/search?q=',
+    'duckduckgo': 'https://duckduckgo.com/?q=',
+    'youtube': 'https://www.youtube.com/results?search_query='
+}
+
+# Short-lived snapshot of the process table; repeated calls within one
+# GUI refresh interval reuse it instead of re-walking every process
+_PROC_CACHE_TTL = 1.0
+_proc_cache = {'ts': 0.0, 'data': []}
+_proc_cache_lock = threading.Lock()
+
+# pyautogui pulls in PIL, pyscreeze and mouseinfo — hundreds of ms on a
+# cold start — so it only loads when an input method is actually used
+_pyautogui = None
+
+def _get_pyautogui():
+    """Import and configure pyautogui on first use"""
+    global _pyautogui
+    if _pyautogui is None:
+        import pyautogui
+        pyautogui.FAILSAFE = True
+        pyautogui.PAUSE = 0.1
+        _pyautogui = pyautogui
+    return _pyautogui
+
 class SystemController:
     """System automation and control operations"""
     
     def __init__(self):
         self.logger = get_logger(__name__)
         self.system = platform.system().lower()
-        
-        # Configure pyautogui
-        pyautogui.FAILSAFE = True
-        pyautogui.PAUSE = 0.1
-        
+
+        # Windows audio endpoint (pycaw COM interface), activated once
+        # on first use and reused for every volume change
+        self._endpoint_volume = None
+
+        # Fields that never change while we're running; the platform
+        # probes can spawn subprocesses on some OSes, so pay for them
+        # once here instead of on every get_system_info call
+        self._static_info = {
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'architecture': platform.architecture()[0],
+            'cpu_count': psutil.cpu_count(),
+            'boot_time': psutil.boot_time()
+        }
+
+        # Prime the non-blocking CPU sampler; the first real reading
+        # after this returns the usage since now instead of 0.0
+        psutil.cpu_percent(interval=None)
+
+        # Shared-memory screen grabber: one display handle reused per
+        # capture instead of the subprocess pyautogui shells out to on
+        # Linux
+        self._sct = None
+        if MSS_AVAILABLE:
+            try:
+                self._sct = mss.mss()
+            except Exception as e:
+                self.logger.debug(f"mss unavailable: {e}")
+
+        # Default screenshot directory exists from here on; the common
+        # capture path skips the per-call makedirs stat
+        os.makedirs(_SCREENSHOT_DIR, exist_ok=True)
+
+        # The platform's URL opener, resolved once so open_website
+        # skips webbrowser's per-call browser detection. Windows has
+        # no command here on purpose: it goes through os.startfile,
+        # which hands the URL to ShellExecute without a cmd.exe parse
+        if self.system == 'linux':
+            self._open_cmd = ['xdg-open']
+        elif self.system == 'darwin':
+            self._open_cmd = ['open']
+        else:
+            self._open_cmd = None
+
+        # Per-platform implementations resolved once: the platform is
+        # fixed for the process lifetime, so the public volume/power
+        # methods call a bound method instead of re-running an if/elif
+        # chain per operation (unknown platforms dispatch to None and
+        # the public methods no-op, as the chains did)
+        self._vol_up = {'windows': self._win_vol_up,
+                        'darwin': self._mac_vol_up,
+                        'linux': self._linux_vol_up}.get(self.system)
+        self._vol_down = {'windows': self._win_vol_down,
+                          'darwin': self._mac_vol_down,
+                          'linux': self._linux_vol_down}.get(self.system)
+        self._vol_mute = {'windows': self._win_mute,
+                          'darwin': self._mac_mute,
+                          'linux': self._linux_mute}.get(self.system)
+        self._vol_set = {'windows': self._win_set_volume,
+                         'darwin': self._mac_set_volume,
+                         'linux': self._linux_set_volume}.get(self.system)
+        self._power_shutdown = {'windows': self._win_shutdown,
+                                'darwin': self._posix_shutdown,
+                                'linux': self._posix_shutdown}.get(self.system)
+        self._power_restart = {'windows': self._win_restart,
+                               'darwin': self._posix_restart,
+                               'linux': self._posix_restart}.get(self.system)
+        self._power_sleep = {'windows': self._win_sleep,
+                             'darwin': self._mac_sleep,
+                             'linux': self._linux_sleep}.get(self.system)
+
         self.logger.info(f"System controller initialized for {self.system}")
+
+    def _get_endpoint_volume(self):
+        """Get the cached Windows IAudioEndpointVolume interface"""
+        if self._endpoint_volume is None:
+            from comtypes import CLSCTX_ALL
+            from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+
+            devices = AudioUtilities.GetSpeakers()
+            interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+            self._endpoint_volume = interface.QueryInterface(IAudioEndpointVolume)
+
+        return self._endpoint_volume
+
+    def _fire(self, cmd: List[str]):
+        """Launch a command without waiting for it
+
+        Volume tweaks and suspend don't need the exit status, so
+        blocking on fork+exec+wait in subprocess.run only added
+        latency to voice commands. close_fds=False skips the
+        per-descriptor close loop that dominates Popen cost on POSIX.
+        """
+        subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=False
+        )
     
-    # Volume Control
+    # Volume Control (per-platform implementations; the public methods
+    # below dispatch through the tables built in __init__)
+    def _win_vol_up(self, step: int):
+        # One COM call instead of step//2 keypresses, each of which
+        # paid the pyautogui PAUSE
+        try:
+            volume = self._get_endpoint_volume()
+            current = volume.GetMasterVolumeLevelScalar()
+            volume.SetMasterVolumeLevelScalar(
+                min(1.0, current + step / 100), None
+            )
+        except Exception:
+            pg = _get_pyautogui()
+            for _ in range(step // 2):
+                pg.press('volumeup')
+
+    def _mac_vol_up(self, step: int):
+        self._fire(['osascript', '-e', f'set volume output volume (output volume of (get volume settings) + {step})'])
+
+    def _linux_vol_up(self, step: int):
+        self._fire(['amixer', 'set', 'Master', f'{step}%+'])
+
+    def _win_vol_down(self, step: int):
+        try:
+            volume = self._get_endpoint_volume()
+            current = volume.GetMasterVolumeLevelScalar()
+            volume.SetMasterVolumeLevelScalar(
+                max(0.0, current - step / 100), None
+            )
+        except Exception:
+            pg = _get_pyautogui()
+            for _ in range(step // 2):
+                pg.press('volumedown')
+
+    def _mac_vol_down(self, step: int):
+        self._fire(['osascript', '-e', f'set volume output volume (output volume of (get volume settings) - {step})'])
+
+    def _linux_vol_down(self, step: int):
+        self._fire(['amixer', 'set', 'Master', f'{step}%-'])
+
+    def _win_mute(self):
+        _get_pyautogui().press('volumemute')
+
+    def _mac_mute(self):
+        self._fire(['osascript', '-e', 'set volume with output muted'])
+
+    def _linux_mute(self):
+        self._fire(['amixer', 'set', 'Master', 'toggle'])
+
+    def _win_set_volume(self, level: int):
+        # Same cached endpoint the step methods use; re-activating the
+        # COM device per call cost ~10ms
+        self._get_endpoint_volume().SetMasterVolumeLevelScalar(level * 0.01, None)
+
+    def _mac_set_volume(self, level: int):
+        self._fire(['osascript', '-e', f'set volume output volume {level}'])
+
+    def _linux_set_volume(self, level: int):
+        self._fire(['amixer', 'set', 'Master', f'{level}%'])
+
     def increase_volume(self, step: int = 10) -> bool:
         """Increase system volume"""
         try:
-            if self.system == 'windows':
-                # Windows volume control
-                for _ in range(step // 2):
-                    pyautogui.press('volumeup')
-            elif self.system == 'darwin':  # macOS
-                subprocess.run(['osascript', '-e', f'set volume output volume (output volume of (get volume settings) + {step})'])
-            elif self.system == 'linux':
-                subprocess.run(['amixer', 'set', 'Master', f'{step}%+'])
-            
+            if self._vol_up:
+                self._vol_up(step)
+
             self.logger.info(f"Volume increased by {step}")
             return True
-            
+
         except Exception as e:
             self.logger.error(f"Error increasing volume: {e}")
             return False
-    
+
     def decrease_volume(self, step: int = 10) -> bool:
         """Decrease system volume"""
         try:
-            if self.system == 'windows':
-                for _ in range(step // 2):
-                    pyautogui.press('volumedown')
-            elif self.system == 'darwin':
-                subprocess.run(['osascript', '-e', f'set volume output volume (output volume of (get volume settings) - {step})'])
-            elif self.system == 'linux':
-                subprocess.run(['amixer', 'set', 'Master', f'{step}%-'])
-            
+            if self._vol_down:
+                self._vol_down(step)
+
             self.logger.info(f"Volume decreased by {step}")
             return True
-            
+
         except Exception as e:
             self.logger.error(f"Error decreasing volume: {e}")
             return False
-    
+
     def mute_volume(self) -> bool:
         """Mute/unmute system volume"""
         try:
-            if self.system == 'windows':
-                pyautogui.press('volumemute')
-            elif self.system == 'darwin':
-                subprocess.run(['osascript', '-e', 'set volume with output muted'])
-            elif self.system == 'linux':
-                subprocess.run(['amixer', 'set', 'Master', 'toggle'])
-            
+            if self._vol_mute:
+                self._vol_mute()
+
             self.logger.info("Volume muted/unmuted")
             return True
-            
+
         except Exception as e:
             self.logger.error(f"Error muting volume: {e}")
             return False
-    
+
     def set_volume(self, level: int) -> bool:
         """Set volume to specific level (0-100)"""
         try:
             level = max(0, min(100, level))
-            
-            if self.system == 'windows':
-                # Windows doesn't have direct volume setting via pyautogui
-                # We'll use a more complex approach
-                import pycaw.pycaw as pycaw
-                from comtypes import CLSCTX_ALL
-                from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
-                
-                devices = AudioUtilities.GetSpeakers()
-                interface = devices.Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
-                volume = interface.QueryInterface(IAudioEndpointVolume)
-                volume.SetMasterScalarVolume(level / 100, None)
-                
-            elif self.system == 'darwin':
-                subprocess.run(['osascript', '-e', f'set volume output volume {level}'])
-            elif self.system == 'linux':
-                subprocess.run(['amixer', 'set', 'Master', f'{level}%'])
-            
+
+            if self._vol_set:
+                self._vol_set(level)
+
             self.logger.info(f"Volume set to {level}")
             return True
-            
+
         except Exception as e:
             self.logger.error(f"Error setting volume: {e}")
             return False
@@ -131,16 +299,70 @@ class SystemController:
             self.logger.error(f"Error opening application {app_name}: {e}")
             return False
     
+    def _close_via_proc(self, app_name: str) -> Optional[bool]:
+        """Find and SIGTERM a process by name via /proc (Linux only)
+
+        Reads just /proc/<pid>/comm per process instead of the several
+        files psutil fetches, which is all a find-by-name needs.
+        Returns None when the scan itself fails so the caller can fall
+        back to psutil.
+        """
+        try:
+            needle = app_name.lower()
+            for pid in os.listdir('/proc'):
+                if not pid.isdigit():
+                    continue
+                try:
+                    with open(f'/proc/{pid}/comm') as f:
+                        name = f.read().strip()
+                except OSError:
+                    continue
+                if needle in name.lower():
+                    os.kill(int(pid), signal.SIGTERM)
+                    return True
+            return False
+
+        except Exception as e:
+            self.logger.debug(f"/proc scan failed: {e}")
+            return None
+
     def close_application(self, app_name: str) -> bool:
         """Close an application"""
         try:
-            # Find and terminate process
-            for proc in psutil.process_iter(['pid', 'name']):
-                if app_name.lower() in proc.info['name'].lower():
-                    proc.terminate()
-                    self.logger.info(f"Closed application: {app_name}")
-                    return True
-            
+            if self.system == 'linux':
+                found = self._close_via_proc(app_name)
+                if found is not None:
+                    if found:
+                        self.logger.info(f"Closed application: {app_name}")
+                        return True
+                    self.logger.warning(f"Application not found: {app_name}")
+                    return False
+
+            # Walk raw PIDs and construct each Process directly; for a
+            # single find-by-name pass this skips process_iter's
+            # per-process info-dict wrapping, and the name is the only
+            # field ever read
+            needle = app_name.lower()
+            for pid in psutil.pids():
+                try:
+                    proc = psutil.Process(pid)
+                    if needle in proc.name().lower():
+                        if os.name == 'posix':
+                            # The PID was just observed, so skip
+                            # terminate()'s is_running re-check; a
+                            # process that vanished in between is a
+                            # no-op, not an error
+                            try:
+                                os.kill(pid, signal.SIGTERM)
+                            except ProcessLookupError:
+                                pass
+                        else:
+                            proc.terminate()
+                        self.logger.info(f"Closed application: {app_name}")
+                        return True
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
+
             self.logger.warning(f"Application not found: {app_name}")
             return False
             
@@ -148,23 +370,82 @@ class SystemController:
             self.logger.error(f"Error closing application {app_name}: {e}")
             return False
     
-    def get_running_applications(self) -> List[Dict[str, Any]]:
-        """Get list of running applications"""
+    @staticmethod
+    def _snapshot_one(pid):
+        """Read (pid, name, rss) for one process, or None if it's gone"""
         try:
-            apps = []
-            for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'cpu_percent']):
-                try:
-                    apps.append({
-                        'pid': proc.info['pid'],
-                        'name': proc.info['name'],
-                        'memory': proc.info['memory_info'].rss if proc.info['memory_info'] else 0,
-                        'cpu': proc.info['cpu_percent']
-                    })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
-            
-            return sorted(apps, key=lambda x: x['memory'], reverse=True)
-            
+            proc = psutil.Process(pid)
+            with proc.oneshot():
+                return pid, proc.name(), proc.memory_info().rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+
+    def _snapshot_processes(self):
+        """Build (pids, names, mems) parallel arrays (cached)
+
+        Keeping the data as three flat lists instead of a list of
+        dicts avoids one tiny object per process; callers rank the
+        arrays themselves.
+        """
+        with _proc_cache_lock:
+            if time.monotonic() - _proc_cache['ts'] < _PROC_CACHE_TTL:
+                return _proc_cache['data']
+
+        # cpu_percent is deliberately not requested: the first sample
+        # always reads 0.0, so it was pure overhead
+        all_pids = psutil.pids()
+
+        # The per-process stats are independent /proc (or handle)
+        # reads that release the GIL, so a small pool overlaps them;
+        # below ~100 processes the pool setup outweighs the win
+        if len(all_pids) > 100:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                rows = list(executor.map(self._snapshot_one, all_pids))
+        else:
+            rows = [self._snapshot_one(pid) for pid in all_pids]
+
+        pids = []
+        names = []
+        mems = []
+        for row in rows:
+            if row is not None:
+                pids.append(row[0])
+                names.append(row[1])
+                mems.append(row[2])
+
+        snapshot = (pids, names, mems)
+
+        with _proc_cache_lock:
+            _proc_cache['ts'] = time.monotonic()
+            _proc_cache['data'] = snapshot
+
+        return snapshot
+
+    def get_running_applications(self, limit: int = 20,
+                                 lightweight: bool = False):
+        """Get running applications, heaviest first
+
+        Returns at most limit dicts — GUIs only show the top of the
+        list, so building 500 result dicts was wasted allocation. With
+        lightweight=True the raw (pids, names, mems) arrays are
+        returned instead for callers that re-sort or filter anyway.
+        """
+        try:
+            pids, names, mems = self._snapshot_processes()
+
+            if lightweight:
+                return pids, names, mems
+
+            # Partial sort: O(n log limit) in C, versus sorting the
+            # whole table to show its top few rows
+            top = heapq.nlargest(limit, range(len(mems)), key=mems.__getitem__)
+
+            return [{
+                'pid': pids[i],
+                'name': names[i],
+                'memory': mems[i]
+            } for i in top]
+
         except Exception as e:
             self.logger.error(f"Error getting running applications: {e}")
             return []
@@ -173,10 +454,21 @@ class SystemController:
     def open_website(self, url: str) -> bool:
         """Open website in default browser"""
         try:
-            if not url.startswith(('http://', 'https://')):
+            if not url.startswith(_SCHEMES):
                 url = 'https://' + url
-            
-            webbrowser.open(url)
+
+            if self.system == 'windows':
+                # Never route URLs through cmd /c start: cmd treats an
+                # unquoted & as a command separator, so a URL with
+                # query parameters would be truncated and its tail run
+                # as a shell command
+                os.startfile(url)
+            elif self._open_cmd is not None:
+                self._fire(self._open_cmd + [url])
+            else:
+                import webbrowser
+                webbrowser.open(url)
+
             self.logger.info(f"Opened website: {url}")
             return True
             
@@ -187,17 +479,11 @@ class SystemController:
     def search_web(self, query: str, engine: str = 'google') -> bool:
         """Search the web"""
         try:
-            search_urls = {
-                'google': 'https://www.google.com/search?q=',
-                'bing': 'https://www.bing.com/search?q=',
-                'duckduckgo': 'https://duckduckgo.com/?q=',
-                'youtube': 'https://www.youtube.com/results?search_query='
-            }
-            
-            base_url = search_urls.get(engine, search_urls['google'])
-            search_url = base_url + query.replace(' ', '+')
-            
-            return self.open_website(search_url)
+            base_url = _SEARCH_URLS.get(engine, _SEARCH_URLS['google'])
+
+            # quote_plus handles &, ?, # and unicode that the old
+            # space-to-plus replace silently passed through broken
+            return self.open_website(base_url + quote_plus(query))
             
         except Exception as e:
             self.logger.error(f"Error searching web: {e}")
@@ -207,15 +493,14 @@ class SystemController:
     def get_system_info(self) -> Dict[str, Any]:
         """Get system information"""
         try:
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # interval=None reads usage since the previous call instead
+            # of sleeping a full second inside every status refresh
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
-            
-            return {
-                'platform': platform.platform(),
-                'processor': platform.processor(),
-                'architecture': platform.architecture()[0],
-                'cpu_count': psutil.cpu_count(),
+
+            info = dict(self._static_info)
+            info.update({
                 'cpu_percent': cpu_percent,
                 'memory_total': memory.total,
                 'memory_available': memory.available,
@@ -224,71 +509,119 @@ class SystemController:
                 'disk_total': disk.total,
                 'disk_used': disk.used,
                 'disk_free': disk.free,
-                'disk_percent': (disk.used / disk.total) * 100,
-                'boot_time': psutil.boot_time()
-            }
-            
+                'disk_percent': (disk.used / disk.total) * 100
+            })
+            return info
+
         except Exception as e:
             self.logger.error(f"Error getting system info: {e}")
             return {}
     
-    # Power Management
+    # Power Management (per-platform implementations; dispatched like
+    # the volume methods)
+    def _win_shutdown(self, delay: int):
+        subprocess.run(['shutdown', '/s', '/t', str(delay)])
+
+    def _posix_shutdown(self, delay: int):
+        subprocess.run(['sudo', 'shutdown', '-h', f'+{delay//60}'])
+
+    def _win_restart(self, delay: int):
+        subprocess.run(['shutdown', '/r', '/t', str(delay)])
+
+    def _posix_restart(self, delay: int):
+        subprocess.run(['sudo', 'shutdown', '-r', f'+{delay//60}'])
+
+    def _win_sleep(self):
+        # Call powrprof.dll directly; no rundll32 process launch just
+        # to reach the same entry point
+        try:
+            import ctypes
+            ctypes.windll.powrprof.SetSuspendState(0, 1, 0)
+        except Exception:
+            self._fire(['rundll32.exe', 'powrprof.dll,SetSuspendState', '0,1,0'])
+
+    def _mac_sleep(self):
+        self._fire(['pmset', 'sleepnow'])
+
+    def _linux_sleep(self):
+        self._fire(['systemctl', 'suspend'])
+
     def shutdown_system(self, delay: int = 0) -> bool:
         """Shutdown the system"""
         try:
-            if self.system == 'windows':
-                subprocess.run(['shutdown', '/s', f'/t', str(delay)])
-            elif self.system == 'darwin':
-                subprocess.run(['sudo', 'shutdown', '-h', f'+{delay//60}'])
-            elif self.system == 'linux':
-                subprocess.run(['sudo', 'shutdown', '-h', f'+{delay//60}'])
-            
+            if self._power_shutdown:
+                self._power_shutdown(delay)
+
             self.logger.info(f"System shutdown initiated with {delay}s delay")
             return True
-            
+
         except Exception as e:
             self.logger.error(f"Error shutting down system: {e}")
             return False
-    
+
     def restart_system(self, delay: int = 0) -> bool:
         """Restart the system"""
         try:
-            if self.system == 'windows':
-                subprocess.run(['shutdown', '/r', f'/t', str(delay)])
-            elif self.system == 'darwin':
-                subprocess.run(['sudo', 'shutdown', '-r', f'+{delay//60}'])
-            elif self.system == 'linux':
-                subprocess.run(['sudo', 'shutdown', '-r', f'+{delay//60}'])
-            
+            if self._power_restart:
+                self._power_restart(delay)
+
             self.logger.info(f"System restart initiated with {delay}s delay")
             return True
-            
+
         except Exception as e:
             self.logger.error(f"Error restarting system: {e}")
             return False
-    
+
     def sleep_system(self) -> bool:
         """Put system to sleep"""
         try:
-            if self.system == 'windows':
-                subprocess.run(['rundll32.exe', 'powrprof.dll,SetSuspendState', '0,1,0'])
-            elif self.system == 'darwin':
-                subprocess.run(['pmset', 'sleepnow'])
-            elif self.system == 'linux':
-                subprocess.run(['systemctl', 'suspend'])
-            
+            if self._power_sleep:
+                self._power_sleep()
+
             self.logger.info("System sleep initiated")
             return True
-            
+
         except Exception as e:
             self.logger.error(f"Error putting system to sleep: {e}")
             return False
     
     # Mouse and Keyboard Control
-    def move_mouse(self, x: int, y: int) -> bool:
-        """Move mouse to coordinates"""
+    @contextmanager
+    def _fast_input(self):
+        """Drop pyautogui's PAUSE sleep and fail-safe corner check
+
+        Every pyautogui call sleeps PAUSE seconds and polls the cursor
+        for the fail-safe corner; for batched programmatic sequences
+        that overhead dominates. Both settings are restored on exit.
+        """
+        pg = _get_pyautogui()
+        pause, failsafe = pg.PAUSE, pg.FAILSAFE
+        pg.PAUSE = 0
+        pg.FAILSAFE = False
         try:
-            pyautogui.moveTo(x, y)
+            yield pg
+        finally:
+            pg.PAUSE = pause
+            pg.FAILSAFE = failsafe
+
+    def move_mouse(self, x: int, y: int, fast: bool = False) -> bool:
+        """Move mouse to coordinates
+
+        fast=True skips the PAUSE sleep and fail-safe check; on
+        Windows it bypasses pyautogui entirely with a direct user32
+        call.
+        """
+        try:
+            if fast:
+                if self.system == 'windows':
+                    import ctypes
+                    ctypes.windll.user32.SetCursorPos(int(x), int(y))
+                else:
+                    with self._fast_input() as pg:
+                        pg.moveTo(x, y)
+                return True
+
+            _get_pyautogui().moveTo(x, y)
             return True
         except Exception as e:
             self.logger.error(f"Error moving mouse: {e}")
@@ -297,10 +630,11 @@ class SystemController:
     def click_mouse(self, x: int = None, y: int = None, button: str = 'left') -> bool:
         """Click mouse at coordinates"""
         try:
+            pg = _get_pyautogui()
             if x is not None and y is not None:
-                pyautogui.click(x, y, button=button)
+                pg.click(x, y, button=button)
             else:
-                pyautogui.click(button=button)
+                pg.click(button=button)
             return True
         except Exception as e:
             self.logger.error(f"Error clicking mouse: {e}")
@@ -309,7 +643,22 @@ class SystemController:
     def type_text(self, text: str) -> bool:
         """Type text"""
         try:
-            pyautogui.typewrite(text)
+            pg = _get_pyautogui()
+
+            # Long strings paste via the clipboard: one copy plus one
+            # hotkey instead of a key event (and PAUSE) per character.
+            # Short strings keep typewrite so per-key handlers in the
+            # target app still fire.
+            if len(text) > 32:
+                try:
+                    import pyperclip
+                    pyperclip.copy(text)
+                    pg.hotkey('command' if self.system == 'darwin' else 'ctrl', 'v')
+                    return True
+                except ImportError:
+                    pass
+
+            pg.typewrite(text)
             return True
         except Exception as e:
             self.logger.error(f"Error typing text: {e}")
@@ -318,7 +667,7 @@ class SystemController:
     def press_key(self, key: str) -> bool:
         """Press keyboard key"""
         try:
-            pyautogui.press(key)
+            _get_pyautogui().press(key)
             return True
         except Exception as e:
             self.logger.error(f"Error pressing key {key}: {e}")
@@ -330,11 +679,19 @@ class SystemController:
             if filename is None:
                 from datetime import datetime
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"output/screenshots/screenshot_{timestamp}.png"
-            
-            os.makedirs(os.path.dirname(filename), exist_ok=True)
-            screenshot = pyautogui.screenshot()
-            screenshot.save(filename)
+                filename = f"{_SCREENSHOT_DIR}/screenshot_{timestamp}.png"
+            else:
+                os.makedirs(os.path.dirname(filename), exist_ok=True)
+
+            if self._sct is not None:
+                # Grab straight from the display; no scrot/
+                # gnome-screenshot subprocess per capture
+                from PIL import Image
+                img = self._sct.grab(self._sct.monitors[0])
+                Image.frombytes('RGB', img.size, img.rgb).save(filename)
+            else:
+                screenshot = _get_pyautogui().screenshot()
+                screenshot.save(filename)
             
             self.logger.info(f"Screenshot saved: {filename}")
             return filename